@@ -1,6 +1,7 @@
 from paramtools.contrib.validate import Range, DateRange, OneOf, When
 from paramtools.contrib.fields import (
     Float64,
+    Float32,
     Int64,
     Bool_,
     MeshFieldMixin,
@@ -9,6 +10,9 @@ from paramtools.contrib.fields import (
     Float,
     Boolean,
     Date,
+    List,
+    get_np_type,
+    make_field,
 )
 
 
@@ -18,6 +22,7 @@ __all__ = [
     "OneOf",
     "When",
     "Float64",
+    "Float32",
     "Int64",
     "Bool_",
     "MeshFieldMixin",
@@ -26,4 +31,7 @@ __all__ = [
     "Float",
     "Boolean",
     "Date",
+    "List",
+    "get_np_type",
+    "make_field",
 ]
@@ -1,15 +1,180 @@
 import numpy as np
 import datetime
+import functools
+import types
 
 from marshmallow import fields as marshmallow_fields
+from marshmallow import utils as marshmallow_utils
+from marshmallow import validate as marshmallow_validate
 
+_NP_TRUE = np.bool_(True)
+_NP_FALSE = np.bool_(False)
+
+_DATE_TYPES = frozenset((datetime.date, datetime.datetime))
+
+# Python and numpy types that can be cast straight to a numeric numpy
+# type. Booleans and None are left out on purpose since marshmallow
+# rejects booleans and passes None through.
+_BULK_CAST_TYPES = frozenset(
+    (int, float, str, np.float64, np.int64, np.float32, np.int32)
+)
+
+
+@functools.lru_cache(maxsize=1024)
+def _parse_iso_date(value):
+    """
+    Parameter files tend to repeat the same few date strings; parse each
+    one once.
+    """
+    return marshmallow_utils.from_iso_date(value)
+
+
+class BoundMethodsMixin:
+    """
+    Binds ``_serialize`` and ``_deserialize`` to the instance once so that
+    marshmallow's per-value calls find them in the instance dictionary
+    instead of creating a new bound method on every call. Copies, which
+    marshmallow makes when binding fields to a schema, are re-bound.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._bind_methods()
+
+    def __copy__(self):
+        cls = self.__class__
+        new = cls.__new__(cls)
+        new.__dict__.update(self.__dict__)
+        new._bind_methods()
+        return new
+
+    def _bind_methods(self):
+        cls = type(self)
+        self._serialize = types.MethodType(cls._serialize, self)
+        self._deserialize = types.MethodType(cls._deserialize, self)
+
+
+def _specialize_serialize(np_type, serialize):
+    """
+    Build a ``_serialize`` method for fields whose values are ``np_type``
+    scalars. Values of exactly that type are boxed with ``item`` after a
+    single identity check; all other values are passed to ``serialize``.
+    """
 
-class NumPySerializeMixin:
     def _serialize(self, value, attr, obj, **kwargs):
-        return value.tolist()
+        if type(value) is np_type:
+            return value.item()
+        return serialize(self, value, attr, obj, **kwargs)
+
+    _serialize.generic = serialize
+    return _serialize
+
+
+class NumPySerializeMixin:
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # Put a _serialize specialized for the class's np_type onto each
+        # concrete class so that it is found in the class's own dictionary
+        # instead of via the MRO.
+        if "_serialize" not in vars(cls):
+            serialize = cls._serialize
+            serialize = getattr(serialize, "generic", serialize)
+            np_type = getattr(cls, "np_type", None)
+            if isinstance(np_type, type):
+                serialize = _specialize_serialize(np_type, serialize)
+            cls._serialize = serialize
 
+    def _serialize(self, value, attr, obj, **kwargs):
+        # numpy scalars and 0-d arrays box directly into a python scalar
+        # without going through the generic ``tolist`` dispatch. Values
+        # that are already python objects are returned as is.
+        t = type(value)
+        if issubclass(t, np.generic):
+            return value.item()
+        if issubclass(t, np.ndarray):
+            return value.tolist() if value.ndim > 0 else value.item()
+        return value
+
+    def _serialize_bulk(self, values):
+        """
+        Serialize a list or array of values with one conversion to python
+        objects. Returns ``None`` if the values can not be converted in
+        bulk, e.g. if they contain ``None``.
+        """
+        if not isinstance(values, np.ndarray) and any(
+            value is None for value in values
+        ):
+            return None
+        try:
+            return np.asarray(values, dtype=self.np_type).tolist()
+        except (TypeError, ValueError, OverflowError):
+            return None
+
+
+class NumPyDeserializeMixin:
+    # Shared numpy scalars for common values. numpy scalars are immutable,
+    # so the same instance can be returned for every occurrence.
+    _scalar_cache = {}
+
+    def _deserialize(self, value, attr, data, **kwargs):
+        # Plain numbers and strings are cast directly, skipping the generic
+        # checks in marshmallow's Number field.
+        if type(value) in _BULK_CAST_TYPES:
+            cached = self._scalar_cache.get(value)
+            if cached is not None:
+                return cached
+            try:
+                return self.np_type(value)
+            except (TypeError, ValueError) as error:
+                raise self.make_error("invalid", input=value) from error
+            except OverflowError as error:
+                raise self.make_error("too_large", input=value) from error
+        return super()._deserialize(value, attr, data, **kwargs)
 
-class Float64(NumPySerializeMixin, marshmallow_fields.Number):
+    def _deserialize_many(self, values):
+        """
+        Deserialize a list of values with a single cast to ``np_type``.
+        Returns ``None`` if the values can not be cast in bulk so that the
+        caller can fall back to deserializing them one at a time and
+        report errors for the offending indices.
+        """
+        if isinstance(values, np.ndarray):
+            return self._fast_cast(values)
+        if not all(type(value) in _BULK_CAST_TYPES for value in values):
+            return None
+        try:
+            # count lets numpy allocate the output array once.
+            return list(
+                np.fromiter(values, dtype=self.np_type, count=len(values))
+            )
+        except (TypeError, ValueError, OverflowError):
+            return None
+
+    @classmethod
+    def _fast_cast(cls, values):
+        """
+        Cast a one dimensional numeric array to ``np_type`` without
+        visiting its items in Python. Returns ``None`` for arrays that need
+        the per-item path: booleans, non-numeric dtypes, and non-finite
+        floats that are cast to an integer type.
+        """
+        if values.ndim != 1 or values.dtype.kind not in "iuf":
+            return None
+        if (
+            values.dtype.kind == "f"
+            and np.issubdtype(cls.np_type, np.integer)
+            and not np.isfinite(values).all()
+        ):
+            return None
+        return list(values.astype(cls.np_type, copy=False))
+
+
+class Float64(
+    BoundMethodsMixin,
+    NumPySerializeMixin,
+    NumPyDeserializeMixin,
+    marshmallow_fields.Number,
+):
     """
     Implements "float" :ref:`spec:Type property` for parameter values.
     Defined as
@@ -17,18 +182,44 @@ class Float64(NumPySerializeMixin, marshmallow_fields.Number):
     """
 
     num_type = np_type = np.float64
+    _scalar_cache = {v: np.float64(v) for v in (0.0, 1.0, -1.0, 0.5)}
 
 
-class Int64(NumPySerializeMixin, marshmallow_fields.Number):
+class Float32(
+    BoundMethodsMixin,
+    NumPySerializeMixin,
+    NumPyDeserializeMixin,
+    marshmallow_fields.Number,
+):
+    """
+    Implements "float32" :ref:`spec:Type property` for parameter values.
+    Defined as
+    `numpy.float32 <https://docs.scipy.org/doc/numpy-1.15.0/user/basics.types.html>`__ type.
+    This is an opt-in alternative to "float" that halves the memory used
+    by parameter arrays at the cost of precision.
+    """
+
+    num_type = np_type = np.float32
+
+
+class Int64(
+    BoundMethodsMixin,
+    NumPySerializeMixin,
+    NumPyDeserializeMixin,
+    marshmallow_fields.Number,
+):
     """
     Implements "int" :ref:`spec:Type property` for parameter values.
     Defined as `numpy.int64 <https://docs.scipy.org/doc/numpy-1.15.0/user/basics.types.html>`__ type
     """
 
     num_type = np_type = np.int64
+    _scalar_cache = {v: np.int64(v) for v in range(-8, 257)}
 
 
-class Bool_(NumPySerializeMixin, marshmallow_fields.Boolean):
+class Bool_(
+    BoundMethodsMixin, NumPySerializeMixin, marshmallow_fields.Boolean
+):
     """
     Implements "bool" :ref:`spec:Type property` for parameter values.
     Defined as `numpy.bool_ <https://docs.scipy.org/doc/numpy-1.15.0/user/basics.types.html>`__ type
@@ -36,8 +227,36 @@ class Bool_(NumPySerializeMixin, marshmallow_fields.Boolean):
 
     num_type = np_type = np.bool_
 
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # Without truthy values, marshmallow falls back to bool(value).
+        if self.truthy:
+            self._bool_lookup = {
+                **{value: _NP_FALSE for value in self.falsy},
+                **{value: _NP_TRUE for value in self.truthy},
+            }
+        else:
+            self._bool_lookup = None
+
     def _deserialize(self, value, attr, obj, **kwargs):
-        return np.bool_(super()._deserialize(value, attr, obj, **kwargs))
+        if super()._deserialize(value, attr, obj, **kwargs):
+            return _NP_TRUE
+        return _NP_FALSE
+
+    def _deserialize_many(self, values):
+        """
+        Deserialize a list of values with one dictionary lookup per value
+        instead of marshmallow's truthy and falsy set checks. Returns
+        ``None`` if a value is not a known boolean literal so that the
+        caller can fall back to deserializing them one at a time.
+        """
+        if self._bool_lookup is None:
+            return None
+        lookup = self._bool_lookup
+        try:
+            return [lookup[value] for value in values]
+        except (KeyError, TypeError):
+            return None
 
 
 class MeshFieldMixin:
@@ -47,21 +266,55 @@ class MeshFieldMixin:
     """
 
     def grid(self):
-        if not self.validators:
-            return []
-        assert len(self.validators) == 1
-        return self.validators[0].grid()
-
-
-class Str(MeshFieldMixin, marshmallow_fields.Str):
+        grid = self.__dict__.get("_grid")
+        if grid is None:
+            validator = self.grid_validator
+            grid = validator.grid() if validator is not None else []
+            self._grid = grid
+        return list(grid)
+
+    @property
+    def grid_validator(self):
+        """
+        The validator whose grid method is used by ``grid``. It is looked
+        up once since validators do not change after the field is created.
+        """
+        if "_grid_validator" not in self.__dict__:
+            assert len(self.validators) <= 1
+            self._grid_validator = (
+                self.validators[0] if self.validators else None
+            )
+        return self._grid_validator
+
+
+class Str(BoundMethodsMixin, MeshFieldMixin, marshmallow_fields.Str):
     """
     Implements "str" :ref:`spec:Type property`.
+
+    If the allowed values are known from ``choices`` or from a ``OneOf``
+    validator, ``np_type`` is a fixed width unicode dtype that fits the
+    longest choice. Otherwise, ``np_type`` is ``object``. Strings longer
+    than the longest choice are truncated when they are written into such
+    an array, so only pass choices that bound every stored value.
     """
 
     np_type = object
 
-
-class Integer(MeshFieldMixin, marshmallow_fields.Integer):
+    def __init__(self, *args, choices=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        if choices is None:
+            for validator in self.validators:
+                if (
+                    isinstance(validator, marshmallow_validate.OneOf)
+                    and getattr(validator, "level", "error") == "error"
+                ):
+                    choices = validator.choices
+                    break
+        if choices and all(isinstance(choice, str) for choice in choices):
+            self.np_type = np.dtype(f"U{max(map(len, choices))}")
+
+
+class Integer(BoundMethodsMixin, MeshFieldMixin, marshmallow_fields.Integer):
     """
     Implements "int" :ref:`spec:Type property` for properties
     except for parameter values.
@@ -70,7 +323,7 @@ class Integer(MeshFieldMixin, marshmallow_fields.Integer):
     np_type = int
 
 
-class Float(MeshFieldMixin, marshmallow_fields.Float):
+class Float(BoundMethodsMixin, MeshFieldMixin, marshmallow_fields.Float):
     """
     Implements "float" :ref:`spec:Type property` for properties
     except for parameter values.
@@ -79,7 +332,7 @@ class Float(MeshFieldMixin, marshmallow_fields.Float):
     np_type = float
 
 
-class Boolean(MeshFieldMixin, marshmallow_fields.Boolean):
+class Boolean(BoundMethodsMixin, MeshFieldMixin, marshmallow_fields.Boolean):
     """
     Implements "bool" :ref:`spec:Type property` for properties
     except for parameter values.
@@ -88,18 +341,115 @@ class Boolean(MeshFieldMixin, marshmallow_fields.Boolean):
     np_type = bool
 
 
-class Date(MeshFieldMixin, marshmallow_fields.Date):
+class Date(BoundMethodsMixin, MeshFieldMixin, marshmallow_fields.Date):
     """
     Implements "date" :ref:`spec:Type property`.
     """
 
     np_type = datetime.date
-    default_error_messages = {
-        "invalid": "Not a valid {obj_type}: {input}",
-        "format": '"{input}" cannot be formatted as a {obj_type}.',
-    }
+    default_error_messages = types.MappingProxyType(
+        {
+            "invalid": "Not a valid {obj_type}: {input}",
+            "format": '"{input}" cannot be formatted as a {obj_type}.',
+        }
+    )
 
     def _deserialize(self, value, attr=None, data=None, **kwargs):
-        if isinstance(value, (datetime.datetime, datetime.date)):
+        if type(value) in _DATE_TYPES:
             return value
+        if isinstance(value, str) and self.format in (None, "iso", "iso8601"):
+            try:
+                return _parse_iso_date(value)
+            except ValueError:
+                # let marshmallow build the error message.
+                pass
+        elif isinstance(value, datetime.date):
+            # subclasses of date, including datetime subclasses.
+            return value
+        return super()._deserialize(value, attr, data, **kwargs)
+
+
+class List(marshmallow_fields.List):
+    """
+    Implements the list type used for parameter values with
+    ``number_dims > 0``. If the inner field defines ``_deserialize_many``
+    or ``_serialize_bulk``, the whole list is deserialized or serialized
+    with one call instead of one call per item.
+    """
+
+    def _deserialize(self, value, attr, data, **kwargs):
+        if (
+            isinstance(value, (list, np.ndarray))
+            and not self.inner.validators
+            and hasattr(self.inner, "_deserialize_many")
+        ):
+            result = self.inner._deserialize_many(value)
+            if result is not None:
+                return result
         return super()._deserialize(value, attr, data, **kwargs)
+
+    def _serialize(self, value, attr, obj, **kwargs):
+        if value is not None and hasattr(self.inner, "_serialize_bulk"):
+            result = self.inner._serialize_bulk(value)
+            if result is not None:
+                return result
+        return super()._serialize(value, attr, obj, **kwargs)
+
+
+# Str is left out since its np_type may be set per instance.
+_FIELD_NP_TYPE = {
+    cls: cls.np_type
+    for cls in (
+        Float64,
+        Float32,
+        Int64,
+        Bool_,
+        Integer,
+        Float,
+        Boolean,
+        Date,
+    )
+}
+
+
+def get_np_type(field):
+    """
+    Get the numpy type of a field instance. Instances of the built-in
+    field classes are resolved with one dictionary lookup; other fields,
+    like ``List`` fields that carry the type of their inner field, fall
+    back to their ``np_type`` attribute.
+    """
+    try:
+        return _FIELD_NP_TYPE[type(field)]
+    except KeyError:
+        return getattr(field, "np_type", object)
+
+
+_FIELD_CACHE = {}
+
+
+def _freeze(value):
+    if isinstance(value, dict):
+        return tuple(sorted((k, _freeze(v)) for k, v in value.items()))
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(v) for v in value)
+    return value
+
+
+def make_field(cls, **kwargs):
+    """
+    Return a shared instance of ``cls`` created with ``kwargs``.
+
+    Fields returned by this function are shared between all callers and
+    must not be modified. This is safe for fields that are only used as
+    schema attributes since marshmallow copies them before binding them
+    to a schema. Arguments that can not be hashed are not cached.
+    """
+    try:
+        key = (cls, _freeze(kwargs))
+        return _FIELD_CACHE[key]
+    except TypeError:
+        return cls(**kwargs)
+    except KeyError:
+        field = _FIELD_CACHE[key] = cls(**kwargs)
+        return field
@@ -1,4 +1,4 @@
-from typing import List
+from typing import Callable, List, Union
 import datetime
 import itertools
 
@@ -32,8 +32,14 @@ class When(ma.validate.Validator):
         self,
         is_object,
         when_vos: List[ValueObject],
-        then_validators: List[ma.validate.Validator],
-        otherwise_validators: List[ma.validate.Validator],
+        then_validators: Union[
+            List[ma.validate.Validator],
+            Callable[[], List[ma.validate.Validator]],
+        ],
+        otherwise_validators: Union[
+            List[ma.validate.Validator],
+            Callable[[], List[ma.validate.Validator]],
+        ],
         then_message: str = None,
         otherwise_message: str = None,
         level: str = "error",
@@ -43,8 +49,10 @@ class When(ma.validate.Validator):
         self.is_operator = next(iter(is_object))
         self.is_val = is_object[self.is_operator]
         self.when_vos = when_vos
-        self.then_validators = then_validators
-        self.otherwise_validators = otherwise_validators
+        # validators may be passed as functions that build them. They are
+        # only called the first time that their branch is used.
+        self._then_validators = then_validators
+        self._otherwise_validators = otherwise_validators
         self.then_message = then_message or self.then_message
         self.otherwise_message = otherwise_message or self.otherwise_message
         self.level = level
@@ -83,6 +91,18 @@ class When(ma.validate.Validator):
                 msgs if len(msgs) > 1 else msgs[0], level=self.level
             )
 
+    @property
+    def then_validators(self):
+        if callable(self._then_validators):
+            self._then_validators = self._then_validators()
+        return self._then_validators
+
+    @property
+    def otherwise_validators(self):
+        if callable(self._otherwise_validators):
+            self._otherwise_validators = self._otherwise_validators()
+        return self._otherwise_validators
+
     def evaluate_is_value(self, when_value):
         return self.is_value_evaluators[self.is_operator](
             when_value, self.is_val
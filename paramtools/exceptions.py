@@ -33,20 +33,27 @@ class InconsistentLabelsException(ParamToolsError):
 
 collision_list = [
     "_data",
+    "_data_version",
     "_errors",
     "_warnings",
     "select_eq",
     "select_gt",
     "_adjust",
+    "_apply_parsed",
     "_numpy_type",
+    "_np_types",
     "_parse_errors",
+    "_patch_arrays",
     "_resolve_order",
+    "_search_tree",
     "_search_trees",
     "_schema",
     "_set_state",
     "_state",
     "_stateless_label_grid",
     "_update_param",
+    "_update_param_by_key",
+    "_value_index",
     "_validator_schema",
     "_defaults_schema",
     "operators",
@@ -78,6 +85,17 @@ collision_list = [
     "index_rates",
     "to_dict",
     "_parse_validation_messages",
+    "_load_schemas",
+    "_schema_cache",
+    "_schema_cache_key",
+    "_schema_cache_lock",
+    "_schema_cache_size",
+    "_stateless_label_grid_ix",
+    "_label_grid_index",
+    "_load",
+    "_specification_cache",
+    "_specification_cache_key",
+    "_specification_cache_version",
 ]
 
 
@@ -1,16 +1,22 @@
 import copy
+import hashlib
 import os
+import sys
 import json
 import itertools
+import math
+import threading
 import warnings
 from collections import OrderedDict, defaultdict
-from functools import partial, reduce
+from functools import reduce
+from operator import itemgetter
 from typing import Optional, Dict, List, Any
 
 import numpy as np
 from marshmallow import ValidationError as MarshmallowValidationError
 
 from paramtools import utils
+from paramtools.contrib.fields import get_np_type
 from paramtools.schema import ParamToolsSchema
 from paramtools.schema_factory import SchemaFactory
 from paramtools.select import select_eq, select_gt_ix, select_gt
@@ -26,7 +32,55 @@ from paramtools.exceptions import (
 )
 
 
+def _round2(v):
+    """
+    Round the float v to two decimals. This gives the same result as
+    np.round(v, 2) but avoids the NumPy call overhead.
+    """
+    scaled = v * 100
+    if math.isfinite(scaled):
+        return round(scaled) / 100
+    return float(np.round(v, 2))
+
+
+def _shrink(value, rates):
+    """
+    Deflate value by each rate in rates, starting from the last one, and
+    round to two decimals after each step.
+    """
+    value = float(value)
+    for rate in reversed(rates):
+        v = value * (1 + rate) ** -1
+        value = _round2(v) if v < 9e99 else 9e99
+    return np.float64(value)
+
+
 class Parameters:
+    # Internal state lives in slots. __dict__ is kept so that parameter
+    # values can still be set as attributes. The operators are not slots
+    # because they are also configured as class attributes.
+    __slots__ = (
+        "__dict__",
+        "_data",
+        "_data_version",
+        "_defaults_schema",
+        "_errors",
+        "_load",
+        "_np_types",
+        "_schema",
+        "_search_trees",
+        "_specification_cache",
+        "_specification_cache_version",
+        "_state",
+        "_stateless_label_grid",
+        "_stateless_label_grid_ix",
+        "_validator_schema",
+        "_value_index",
+        "_warnings",
+        "label_grid",
+        "label_validators",
+    )
+
     defaults = None
     field_map: Dict = {}
     array_first: bool = False
@@ -34,6 +88,11 @@ class Parameters:
     uses_extend_func: bool = False
     index_rates: Dict = {}
 
+    # Schemas shared by instances that use the same defaults and field_map.
+    _schema_cache: Dict = OrderedDict()
+    _schema_cache_lock = threading.Lock()
+    _schema_cache_size = 128
+
     def __init__(
         self,
         initial_state: Optional[dict] = None,
@@ -42,23 +101,21 @@ class Parameters:
         uses_extend_func: bool = False,
         index_rates: Optional[dict] = None,
     ):
-        schemafactory = SchemaFactory(self.defaults, self.field_map)
-        (
-            self._defaults_schema,
-            self._validator_schema,
-            self._schema,
-            self._data,
-        ) = schemafactory.schemas()
-        self.label_validators = schemafactory.label_validators
-        self._stateless_label_grid = OrderedDict(
-            [(name, v.grid()) for name, v in self.label_validators.items()]
+        self._load_schemas()
+        self.label_grid = OrderedDict(
+            (name, list(grid))
+            for name, grid in self._stateless_label_grid.items()
         )
-        self.label_grid = copy.deepcopy(self._stateless_label_grid)
         self._validator_schema.context["spec"] = self
+        self._load = self._validator_schema.load
         self._warnings = {}
         self._errors = {}
         self._state = initial_state or {}
         self._search_trees = {}
+        self._value_index = {}
+        self._data_version = 0
+        self._specification_cache = {}
+        self._specification_cache_version = 0
         self.index_rates = index_rates or self.index_rates
 
         # set operators in order of importance:
@@ -78,6 +135,9 @@ class Parameters:
                 if value != default and value is not None:
                     setattr(self, name, value)
                     break
+        if isinstance(self.label_to_extend, str):
+            # match the interned label names used as value object keys.
+            self.label_to_extend = sys.intern(self.label_to_extend)
 
         if self.label_to_extend:
             prev_array_first = self.array_first
@@ -94,6 +154,98 @@ class Parameters:
             self._schema["operators"] = {}
         self._schema["operators"].update(self.operators)
 
+    def _load_schemas(self):
+        """
+        Build the schemas, default data, and label validators for this
+        instance. Building the schemas is expensive, so the results are
+        cached by ``defaults`` and ``field_map``. Only the parts that are
+        not modified are shared: each instance gets its own validator
+        schema instance and its own copy of the data and schema.
+        """
+        key = self._schema_cache_key()
+        cached = None
+        if key is not None:
+            with self._schema_cache_lock:
+                cached = self._schema_cache.get(key)
+
+        if cached is None:
+            schemafactory = SchemaFactory(self.defaults, self.field_map)
+            (
+                self._defaults_schema,
+                self._validator_schema,
+                self._schema,
+                self._data,
+            ) = schemafactory.schemas()
+            self.label_validators = schemafactory.label_validators
+            label_grid = tuple(
+                (name, tuple(v.grid()))
+                for name, v in self.label_validators.items()
+            )
+            if key is not None:
+                cached = (
+                    self._defaults_schema,
+                    type(self._validator_schema),
+                    copy.deepcopy(self._schema),
+                    copy.deepcopy(self._data),
+                    self.label_validators,
+                    label_grid,
+                    # Hold a reference so that id(field_map) in the key
+                    # can not be reused while this entry exists.
+                    self.field_map,
+                )
+                with self._schema_cache_lock:
+                    self._schema_cache[key] = cached
+                    if len(self._schema_cache) > self._schema_cache_size:
+                        self._schema_cache.popitem(last=False)
+        else:
+            (
+                self._defaults_schema,
+                ValidatorSchema,
+                schema,
+                data,
+                self.label_validators,
+                label_grid,
+                _,
+            ) = cached
+            self._validator_schema = ValidatorSchema()
+            self._schema = copy.deepcopy(schema)
+            self._data = copy.deepcopy(data)
+
+        self._stateless_label_grid = OrderedDict(
+            (name, list(grid)) for name, grid in label_grid
+        )
+        self._stateless_label_grid_ix = {
+            name: utils.grid_index(grid)
+            for name, grid in self._stateless_label_grid.items()
+        }
+        self._np_types = {
+            param: get_np_type(field.schema.fields["value"])
+            for param, field in self._validator_schema.fields.items()
+        }
+
+    def _schema_cache_key(self):
+        """
+        Key for the schema cache. File paths are identified by their path
+        and modification time, and dicts and JSON strings by a hash of
+        their contents. Returns None if the defaults can not be keyed.
+        """
+        defaults = self.defaults
+        try:
+            if isinstance(defaults, str) and os.path.exists(defaults):
+                content = (
+                    os.path.abspath(defaults),
+                    os.path.getmtime(defaults),
+                )
+            elif isinstance(defaults, (str, dict)):
+                content = hashlib.blake2b(
+                    json.dumps(defaults, sort_keys=True, default=str).encode()
+                ).digest()
+            else:
+                return None
+        except (TypeError, ValueError):
+            return None
+        return (content, id(self.field_map))
+
     def set_state(self, **labels):
         """
         Sets state for the Parameters instance. The state, label_grid, and
@@ -112,7 +264,10 @@ class Parameters:
         Reset the state of the Parameters instance.
         """
         self._state = {}
-        self.label_grid = copy.deepcopy(self._stateless_label_grid)
+        self.label_grid = OrderedDict(
+            (name, list(grid))
+            for name, grid in self._stateless_label_grid.items()
+        )
         self.set_state()
 
     def view_state(self):
@@ -122,10 +277,17 @@ class Parameters:
         return self._state
 
     def read_params(self, params_or_path):
-        if isinstance(params_or_path, str) and os.path.exists(params_or_path):
-            params = utils.read_json(params_or_path)
+        # JSON documents start with "{" or "[", which lets large
+        # adjustments skip the stat call on the whole string.
+        if (
+            isinstance(params_or_path, str)
+            and params_or_path.lstrip()[:1] not in ("{", "[")
+            and os.path.exists(params_or_path)
+        ):
+            with open(params_or_path, "rb") as f:
+                params = utils.load_json(f.read())
         elif isinstance(params_or_path, str):
-            params = json.loads(params_or_path)
+            params = utils.load_json(params_or_path)
         elif isinstance(params_or_path, dict):
             params = params_or_path
         else:
@@ -178,26 +340,28 @@ class Parameters:
         # Validate user adjustments.
         parsed_params = {}
         try:
-            parsed_params = self._validator_schema.load(
-                params, ignore_warnings
-            )
+            parsed_params = self._load(params, ignore_warnings)
         except MarshmallowValidationError as ve:
             self._parse_validation_messages(ve.messages, params)
 
-        if not self._errors:
+        # errors, including those left over from earlier adjustments made
+        # with raise_errors=False, keep the adjustment from being applied.
+        applied = not self._errors
+        if applied:
             if self.label_to_extend is not None and extend_adj:
                 extend_grid = self._stateless_label_grid[self.label_to_extend]
+                active_values = set(self.label_grid[self.label_to_extend])
                 to_delete = defaultdict(list)
                 backup = {}
                 for param, vos in parsed_params.items():
                     for vo in utils.grid_sort(
-                        vos, self.label_to_extend, extend_grid
+                        vos,
+                        self.label_to_extend,
+                        extend_grid,
+                        self._stateless_label_grid_ix[self.label_to_extend],
                     ):
                         if self.label_to_extend in vo:
-                            if (
-                                vo[self.label_to_extend]
-                                not in self.label_grid[self.label_to_extend]
-                            ):
+                            if vo[self.label_to_extend] not in active_values:
                                 msg = (
                                     f"{param}[{self.label_to_extend}={vo[self.label_to_extend]}] "
                                     f"is not active in the current state: "
@@ -214,7 +378,7 @@ class Parameters:
                                     ]
                                 },
                                 extend_grid,
-                                tree=self._search_trees.get(param),
+                                tree=self._search_tree(param),
                             )
                             eq = select_eq(
                                 gt,
@@ -227,27 +391,26 @@ class Parameters:
                                 dict(td, **{"value": None}) for td in eq
                             ]
                     # make copy of value objects since they
-                    # are about to be modified
-                    backup[param] = copy.deepcopy(self._data[param]["value"])
+                    # are about to be modified. _update_param only replaces
+                    # values and never mutates them, so shallow copies of
+                    # the value objects are enough.
+                    backup[param] = [
+                        dict(vo) for vo in self._data[param]["value"]
+                    ]
                 try:
                     array_first = self.array_first
                     self.array_first = False
 
+                    # Warnings from validating the user adjustments abort
+                    # the adjustment unless they are ignored.
+                    if not ignore_warnings and self._warnings.get("messages"):
+                        raise self.validation_error
+
                     # delete params that will be overwritten out by extend.
-                    self._adjust(
-                        to_delete,
-                        extend_adj=False,
-                        raise_errors=True,
-                        ignore_warnings=ignore_warnings,
-                    )
+                    self._apply_parsed(to_delete)
 
                     # set user adjustments.
-                    self._adjust(
-                        parsed_params,
-                        extend_adj=False,
-                        raise_errors=True,
-                        ignore_warnings=ignore_warnings,
-                    )
+                    self._apply_parsed(parsed_params)
                     self.extend(
                         params=parsed_params.keys(),
                         ignore_warnings=ignore_warnings,
@@ -256,13 +419,11 @@ class Parameters:
                 except ValidationError:
                     for param in backup:
                         self._data[param]["value"] = backup[param]
+                        self._search_trees.pop(param, None)
                 finally:
                     self.array_first = array_first
             else:
-                for param, value in parsed_params.items():
-                    self._update_param(param, value)
-
-        self._validator_schema.context["spec"] = self
+                self._apply_parsed(parsed_params)
 
         has_errors = bool(self._errors.get("messages"))
         has_warnings = bool(self._warnings.get("messages"))
@@ -272,8 +433,18 @@ class Parameters:
         ):
             raise self.validation_error
 
-        # Update attrs for params that were adjusted.
-        self._set_state(params=parsed_params.keys())
+        self._data_version += 1
+
+        # Update attrs for params that were adjusted. Without extend, the
+        # applied values can be written straight into the existing arrays.
+        to_set = parsed_params.keys()
+        if (
+            applied
+            and self.array_first
+            and not (self.label_to_extend is not None and extend_adj)
+        ):
+            to_set = self._patch_arrays(parsed_params)
+        self._set_state(params=to_set)
 
         return parsed_params
 
@@ -350,6 +521,11 @@ class Parameters:
                 description and title.
             - include_empty: If true, include parameters that do not meet the label query.
             - serializable: If true, return data that is compatible with `json.dumps`.
+                Serializable results are cached until the parameter data is
+                changed through this instance's methods (e.g. `adjust`,
+                `extend`, or `sort_values`). Value objects edited
+                in place, e.g. through a parameter attribute when
+                array_first is off, are not seen until then.
 
         Returns: serialized data of shape
             {"param_name": [{"value": val, "label0": ..., }], ...}
@@ -357,6 +533,14 @@ class Parameters:
         if use_state:
             labels.update(self._state)
 
+        if serializable:
+            cache_key = self._specification_cache_key(
+                labels, meta_data, include_empty, sort_values
+            )
+            if cache_key in self._specification_cache:
+                # callers own the returned data; never hand out the cache.
+                return copy.deepcopy(self._specification_cache[cache_key])
+
         all_params = OrderedDict()
         for param in self._validator_schema.fields:
             result = self.select_eq(param, False, **labels)
@@ -375,10 +559,29 @@ class Parameters:
             # Unpack the values after serialization if meta_data not specified.
             if not meta_data:
                 ser = {param: value["value"] for param, value in ser.items()}
+            if cache_key is not None:
+                self._specification_cache[cache_key] = ser
+                return copy.deepcopy(ser)
             return ser
         else:
             return all_params
 
+    def _specification_cache_key(self, labels, *args):
+        """
+        Key for caching serialized specifications. Cached results are
+        dropped when the parameter data changes. None is returned when the
+        label query cannot be hashed.
+        """
+        if self._specification_cache_version != self._data_version:
+            self._specification_cache.clear()
+            self._specification_cache_version = self._data_version
+        try:
+            key = (frozenset(labels.items()),) + args
+            hash(key)
+        except TypeError:
+            return None
+        return key
+
     def to_array(self, param):
         """
         Convert a Value object to an n-labelal array. The list of Value
@@ -425,6 +628,8 @@ class Parameters:
             value = value_items[0]["value"]
             if data_type == object:
                 return value
+            elif isinstance(data_type, np.dtype):
+                return data_type.type(value)
             else:
                 return data_type(value)
         exp_full_shape = reduce(lambda x, y: x * y, shape)
@@ -444,22 +649,24 @@ class Parameters:
                 f"parameter space. Missing combinations:\n\t{missing}"
             )
 
-        def list_2_tuple(x):
-            return tuple(x) if isinstance(x, list) else x
-
-        arr = np.empty(shape, dtype=self._numpy_type(param))
+        data_type = self._numpy_type(param)
+        arr = np.empty(shape, dtype=data_type)
 
-        for vi in value_items:
-            # ix stores the indices of `arr` that need to be filled in.
-            ix = [[] for i in range(len(label_order))]
-            for label_pos, label_name in enumerate(label_order):
-                # assume value_items is dense in the sense that it spans
-                # the label space.
-                ix[label_pos].append(
-                    value_order[label_name].index(vi[label_name])
-                )
-            ix = tuple(map(list_2_tuple, ix))
-            arr[ix] = vi["value"]
+        # Map each label value to its position along its axis so that the
+        # indices of `arr` can be filled in one pass and assigned at once.
+        pos_maps = [
+            {label_value: i for i, label_value in enumerate(value_order[name])}
+            for name in label_order
+        ]
+        idx = np.empty((len(label_order), len(value_items)), dtype=np.intp)
+        vals = np.empty(len(value_items), dtype=data_type)
+        for k, vi in enumerate(value_items):
+            # assume value_items is dense in the sense that it spans
+            # the label space.
+            for d, label_name in enumerate(label_order):
+                idx[d, k] = pos_maps[d][vi[label_name]]
+            vals[k] = vi["value"]
+        arr[tuple(idx)] = vals
         return arr
 
     def from_array(self, param, array=None):
@@ -482,14 +689,23 @@ class Parameters:
                 )
         value_items = self.select_eq(param, False, **self._state)
         label_order, value_order = self._resolve_order(param, value_items)
-        label_values = itertools.product(*value_order.values())
-        label_indices = itertools.product(
-            *map(lambda x: range(len(x)), value_order.values())
-        )
+        if not label_order:
+            return [{"value": array[()]}]
+        shape = tuple(len(value_order[label]) for label in label_order)
+        # Row-major indices of every cell in the label space, one row per
+        # label. This is the same order that itertools.product yields.
+        indices = np.indices(shape).reshape(len(shape), -1)
+        values = array[tuple(indices)]
+        columns = [
+            [value_order[label][i] for i in label_ix]
+            for label, label_ix in zip(label_order, indices.tolist())
+        ]
         value_items = []
-        for dv, di in zip(label_values, label_indices):
-            vi = {label_order[j]: dv[j] for j in range(len(dv))}
-            vi["value"] = array[di]
+        for k, value in enumerate(values):
+            vi = {
+                label: column[k] for label, column in zip(label_order, columns)
+            }
+            vi["value"] = value
             value_items.append(vi)
         return value_items
 
@@ -511,52 +727,59 @@ class Parameters:
         if label_to_extend is None:
             label_to_extend = self.label_to_extend
 
-        spec = self.specification(meta_data=True)
         if params is not None:
+            # Only query the requested parameters, in schema order.
             spec = {
                 param: self._data[param]
-                for param, data in spec.items()
+                for param in self._validator_schema.fields
                 if param in params
+                and self.select_eq(param, False, **self._state)
             }
+        else:
+            spec = self.specification(meta_data=True)
         extend_grid = (
             label_to_extend_values
             or self._stateless_label_grid[label_to_extend]
         )
-        adjustment = defaultdict(list)
+        grid_ix = self._label_grid_index(label_to_extend, extend_grid)
+        # (param, value object) pairs, grouped by parameter at the end.
+        extensions = []
         for param, data in spec.items():
             if not any(label_to_extend in vo for vo in data["value"]):
                 continue
+            # Value objects are tracked by id: they all come from
+            # self._data[param]["value"] and stay alive for the whole pass.
             extended_vos = set()
             for vo in sorted(
                 data["value"],
-                key=lambda val: extend_grid.index(val[label_to_extend]),
+                key=lambda val: grid_ix[val[label_to_extend]],
             ):
-                hashable_vo = utils.hashable_value_object(vo)
-                if hashable_vo in extended_vos:
+                vo_id = id(vo)
+                if vo_id in extended_vos:
                     continue
                 else:
-                    extended_vos.add(hashable_vo)
+                    extended_vos.add(vo_id)
                 gt = select_gt_ix(
                     self._data[param]["value"],
                     False,
                     {label_to_extend: vo[label_to_extend]},
                     extend_grid,
-                    tree=self._search_trees.get(param),
+                    tree=self._search_tree(param),
                 )
                 eq = select_eq(
                     gt,
                     False,
                     utils.filter_labels(vo, drop=["value", label_to_extend]),
                 )
-                extended_vos.update(map(utils.hashable_value_object, eq))
+                extended_vos.update(map(id, eq))
                 eq += [vo]
 
                 defined_vals = {eq_vo[label_to_extend] for eq_vo in eq}
 
-                missing_vals = sorted(
-                    set(extend_grid) - defined_vals,
-                    key=lambda val: extend_grid.index(val),
-                )
+                # grid_ix holds each grid value once, in grid order.
+                missing_vals = [
+                    val for val in grid_ix if val not in defined_vals
+                ]
 
                 if not missing_vals:
                     continue
@@ -564,11 +787,11 @@ class Parameters:
                 extended = defaultdict(list)
 
                 for val in missing_vals:
-                    eg_ix = extend_grid.index(val)
+                    eg_ix = grid_ix[val]
                     if eg_ix == 0:
                         first_defined_value = min(
                             defined_vals,
-                            key=lambda val: extend_grid.index(val),
+                            key=lambda val: grid_ix[val],
                         )
                         value_objects = select_eq(
                             eq, True, {label_to_extend: first_defined_value}
@@ -593,11 +816,12 @@ class Parameters:
                             extend_grid,
                             label_to_extend,
                         )
-                        extended_vos.add(
-                            utils.hashable_value_object(value_object)
-                        )
+                        extended_vos.add(id(value_object))
                         extended[val].append(ext)
-                        adjustment[param].append(ext)
+                        extensions.append((param, ext))
+        adjustment = {}
+        for param, ext in extensions:
+            adjustment.setdefault(param, []).append(ext)
         # Ensure that the adjust method of paramtools.Parameter is used
         # in case the child class also implements adjust.
         self._adjust(
@@ -629,11 +853,13 @@ class Parameters:
         ):
             return extend_vo
 
+        grid_ix = self._label_grid_index(label_to_extend, extend_grid)
+
         known_val = known_vo[label_to_extend]
-        known_ix = extend_grid.index(known_val)
+        known_ix = grid_ix[known_val]
 
         toext_val = extend_vo[label_to_extend]
-        toext_ix = extend_grid.index(toext_val)
+        toext_ix = grid_ix[toext_val]
 
         if toext_ix > known_ix:
             # grow value according to the index rate supplied by the user defined
@@ -641,16 +867,21 @@ class Parameters:
             v = extend_vo["value"] * (
                 1 + self.get_index_rate(param, known_val)
             )
-            extend_vo["value"] = np.round(v, 2) if v < 9e99 else 9e99
+            if not v < 9e99:
+                extend_vo["value"] = 9e99
+            elif isinstance(v, float):
+                extend_vo["value"] = np.float64(_round2(v))
+            else:
+                extend_vo["value"] = np.round(v, 2)
         else:
             # shrink value according to the index rate supplied by the user defined
             # self.indexing_rate method.
-            for ix in reversed(range(toext_ix, known_ix)):
-                v = (
-                    extend_vo["value"]
-                    * (1 + self.get_index_rate(param, extend_grid[ix])) ** -1
-                )
-                extend_vo["value"] = np.round(v, 2) if v < 9e99 else 9e99
+            if toext_ix < known_ix:
+                rates = [
+                    self.get_index_rate(param, extend_grid[ix])
+                    for ix in range(toext_ix, known_ix)
+                ]
+                extend_vo["value"] = _shrink(extend_vo["value"], rates)
         return extend_vo
 
     def get_index_rate(self, param: str, lte_val: Any):
@@ -662,6 +893,16 @@ class Parameters:
         """
         return self.index_rates[lte_val]
 
+    def _label_grid_index(self, label, grid):
+        """
+        Map each value in grid to its position in grid. The maps for the
+        stateless label grids are built once when the instance is created;
+        maps for other grids are built on demand.
+        """
+        if grid is self._stateless_label_grid.get(label):
+            return self._stateless_label_grid_ix[label]
+        return utils.grid_index(grid)
+
     def _set_state(self, params=None, **labels):
         """
         Private method for setting the state on a Parameters instance. Internal
@@ -687,9 +928,13 @@ class Parameters:
             if not isinstance(label_value, list):
                 label_value = [label_value]
             self.label_grid[label_name] = label_value
-        spec = self.specification(include_empty=True, **self._state)
         if params is not None:
-            spec = {param: spec[param] for param in params}
+            spec = {
+                param: self.select_eq(param, False, **self._state)
+                for param in params
+            }
+        else:
+            spec = self.specification(include_empty=True, **self._state)
         for name, value in spec.items():
             if name in collision_list:
                 raise ParameterNameCollisionException(
@@ -700,6 +945,55 @@ class Parameters:
             else:
                 setattr(self, name, value)
 
+    def _patch_arrays(self, parsed_params):
+        """
+        Write adjusted values into copies of the arrays that were built
+        by to_array instead of rebuilding them from every value object.
+        This only works when each adjusted value object replaced existing
+        values, i.e. nothing was deleted or appended.
+
+        Returns: list of parameters that could not be patched.
+        """
+        rebuild = []
+        for param, vos in parsed_params.items():
+            arr = getattr(self, param, None)
+            if (
+                not isinstance(arr, np.ndarray)
+                or self._data[param].get("number_dims", 0) > 0
+                or any(vo["value"] is None for vo in vos)
+            ):
+                rebuild.append(param)
+                continue
+            value_items = self.select_eq(param, False, **self._state)
+            label_order, value_order = self._resolve_order(param, value_items)
+            shape = tuple(len(value_order[label]) for label in label_order)
+            if (
+                not shape
+                or arr.shape != shape
+                or arr.size != len(value_items)
+                or arr.dtype != np.dtype(self._numpy_type(param))
+            ):
+                rebuild.append(param)
+                continue
+            pos_maps = [
+                utils.grid_index(value_order[label]) for label in label_order
+            ]
+            arr = arr.copy()
+            for vo in vos:
+                ix = []
+                for label, pos_map in zip(label_order, pos_maps):
+                    if label not in vo:
+                        ix.append(slice(None))
+                    elif vo[label] in pos_map:
+                        ix.append(pos_map[vo[label]])
+                    else:
+                        # Not in the current state; no cells to update.
+                        break
+                else:
+                    arr[tuple(ix)] = vo["value"]
+            setattr(self, param, arr)
+        return rebuild
+
     def _resolve_order(self, param, value_items):
         """
         Resolve the order of the labels and their values by
@@ -735,16 +1029,14 @@ class Parameters:
         """
         Get the numpy type for a given parameter.
         """
-        return (
-            self._validator_schema.fields[param].schema.fields["value"].np_type
-        )
+        return self._np_types[param]
 
     def select_eq(self, param, exact_match, **labels):
         return select_eq(
             self._data[param]["value"],
             exact_match,
             labels,
-            tree=self._search_trees.get(param),
+            tree=self._search_tree(param),
         )
 
     def select_gt(self, param, exact_match, **labels):
@@ -752,9 +1044,17 @@ class Parameters:
             self._data[param]["value"],
             exact_match,
             labels,
-            tree=self._search_trees.get(param),
+            tree=self._search_tree(param),
         )
 
+    def _apply_parsed(self, parsed):
+        """
+        Apply adjustments that have already been validated by
+        _validator_schema or were built internally from validated data.
+        """
+        for param, value in parsed.items():
+            self._update_param(param, value)
+
     def _update_param(self, param, new_values):
         """
         Update the current parameter values with those specified by
@@ -772,15 +1072,92 @@ class Parameters:
             expensive to check this case, especially when a project is extending parameters.
             For now, no exceptions are raised by this method.
 
+        """
+        if not self._update_param_by_key(param, new_values):
+            self._value_index.pop(param, None)
+            curr_tree = self._search_tree(param)
+            if len(new_values) == 1:
+                self._data[param]["value"] = curr_tree.update_one(
+                    new_values[0]
+                )
+            else:
+                new_tree = Tree(vos=new_values, label_grid=self.label_grid)
+                self._data[param]["value"] = curr_tree.update(new_tree)
+        self._data_version += 1
+
+    def _update_param_by_key(self, param, new_values):
+        """
+        Fast path for _update_param when every new value object uses
+        exactly the labels of param's value objects and none of them are
+        deletions. The current value objects are indexed by their label
+        values, so each new value object is matched with one dict lookup
+        instead of intersecting the search tree's index sets. Unmatched
+        value objects are appended, like in Tree.update.
+
+        Returns: False if the generic Tree update must be used instead.
         """
         curr_values = self._data[param]["value"]
-        if param in self._search_trees:
-            curr_tree = self._search_trees[param]
-        else:
-            curr_tree = Tree(vos=curr_values, label_grid=self.label_grid)
-        new_tree = Tree(vos=new_values, label_grid=self.label_grid)
-        self._data[param]["value"] = curr_tree.update(new_tree)
-        self._search_trees[param] = curr_tree
+        cached = self._value_index.get(param)
+        if (
+            cached is None
+            or cached[0] is not curr_values
+            or cached[1] != len(curr_values)
+        ):
+            if not curr_values:
+                return False
+            labels = tuple(
+                label for label in curr_values[0] if label != "value"
+            )
+            if not labels:
+                return False
+            getter = itemgetter(*labels)
+            index = defaultdict(list)
+            try:
+                for ix, vo in enumerate(curr_values):
+                    index[getter(vo)].append(ix)
+            except KeyError:
+                return False
+            cached = [curr_values, len(curr_values), getter, labels, index]
+            self._value_index[param] = cached
+        _, _, getter, labels, index = cached
+
+        keys = []
+        for vo in new_values:
+            if len(vo) != len(labels) + 1 or vo.get("value") is None:
+                return False
+            try:
+                keys.append(getter(vo))
+            except KeyError:
+                return False
+
+        not_matched = []
+        for key, vo in zip(keys, new_values):
+            if key in index:
+                for ix in index[key]:
+                    curr_values[ix]["value"] = vo["value"]
+            else:
+                not_matched.append((key, vo))
+        if not_matched:
+            for key, vo in not_matched:
+                index[key].append(len(curr_values))
+                curr_values.append(vo)
+            cached[1] = len(curr_values)
+            # The search tree does not know about the new value objects.
+            self._search_trees.pop(param, None)
+        return True
+
+    def _search_tree(self, param):
+        """
+        Return the search tree for param's value objects, building it if it
+        does not exist yet or if it indexes a list that has since been
+        replaced.
+        """
+        values = self._data[param]["value"]
+        tree = self._search_trees.get(param)
+        if tree is None or tree.vos is not values:
+            tree = Tree(vos=values, label_grid=self.label_grid)
+            self._search_trees[param] = tree
+        return tree
 
     def _parse_validation_messages(self, messages, params):
         """Parse validation messages from marshmallow"""
@@ -845,33 +1222,53 @@ class Parameters:
             "labels": defaultdict(dict),
         }
 
+        flatten = itertools.chain.from_iterable
+        ensure_value_object = utils.ensure_value_object
+        filter_labels = utils.filter_labels
+        messages_out = error_info["messages"]
+        labels_out = error_info["labels"]
+        # value objects can be shared between parameters in the same
+        # adjustment. The cache holds a reference to each value object so
+        # that its id cannot be reused while the cache is alive.
+        label_cache = {}
         for pname, data in messages.items():
             if pname == "_schema":
-                error_info["messages"]["schema"] = [
-                    f"Data format error: {data}"
-                ]
+                messages_out["schema"] = [f"Data format error: {data}"]
                 continue
             if data == ["Unknown field."]:
-                error_info["messages"]["schema"] = [f"Unknown field: {pname}"]
+                messages_out["schema"] = [f"Unknown field: {pname}"]
                 continue
-            param_data = utils.ensure_value_object(params[pname])
+            param_data = ensure_value_object(params[pname])
             error_labels = []
             formatted_errors = []
             for ix, marshmessages in data.items():
-                error_labels.append(
-                    utils.filter_labels(param_data[ix], drop=["value"])
+                # flatten {field: [msg, ...]} and {field: {i: [msg, ...]}}
+                # into a single list of messages.
+                formatted_errors_ix = list(
+                    flatten(
+                        (
+                            msgs
+                            if isinstance(msgs, list)
+                            else flatten(msgs.values())
+                        )
+                        for msgs in marshmessages.values()
+                        if msgs
+                    )
                 )
-                formatted_errors_ix = []
-                for _, messages in marshmessages.items():
-                    if messages:
-                        if isinstance(messages, list):
-                            formatted_errors_ix += messages
-                        else:
-                            for _, messagelist in messages.items():
-                                formatted_errors_ix += messagelist
+                # labels are only needed for value objects with messages.
+                # Both lists skip the same value objects, so they stay
+                # aligned.
+                if not formatted_errors_ix:
+                    continue
+                vo = param_data[ix]
+                cached = label_cache.get(id(vo))
+                if cached is None:
+                    cached = (vo, filter_labels(vo, drop=["value"]))
+                    label_cache[id(vo)] = cached
+                error_labels.append(cached[1])
                 formatted_errors.append(formatted_errors_ix)
-            error_info["messages"][pname] = formatted_errors
-            error_info["labels"][pname] = error_labels
+            messages_out[pname] = formatted_errors
+            labels_out[pname] = error_labels
 
         return error_info
 
@@ -911,43 +1308,58 @@ class Parameters:
             {param: {"value": [...value objects]}}
         """
 
-        def keyfunc(vo, label, label_values):
-            if label in vo:
-                return label_values.index(vo[label])
-            else:
-                return -1
-
         # nothing to do if labels aren't specified
         if not self._stateless_label_grid:
             return
 
-        # iterate over labels so that the first label's order
-        # takes precedence.
-        label_grid = self._stateless_label_grid
-        order = list(reversed(label_grid))
+        # labels are compared in schema order so that the first label's
+        # order takes precedence.
+        label_maps = [
+            (label, self._stateless_label_grid_ix[label], values)
+            for label, values in self._stateless_label_grid.items()
+        ]
 
+        def keyfunc(vo):
+            key = []
+            for label, label_ix, label_values in label_maps:
+                if label in vo:
+                    try:
+                        key.append(label_ix[vo[label]])
+                    except KeyError:
+                        # unknown value: let list.index raise as before.
+                        key.append(label_values.index(vo[label]))
+                else:
+                    key.append(-1)
+            return tuple(key)
+
+        own_data = self._data
         if data is None:
-            data = self._data
-            update_attrs = True
+            data = own_data
             if not has_meta_data:
                 raise ParamToolsError(
                     "has_meta_data must be True if data is not specified."
                 )
+            # Only update attributes when array first is off, since
+            # value order will not affect how arrays are constructed.
+            update_attrs = not self.array_first
         else:
             update_attrs = False
 
         for param, param_data in data.items():
-            for label in order:
-                label_values = label_grid[label]
-                pfunc = partial(
-                    keyfunc, label=label, label_values=label_values
-                )
-                if has_meta_data:
-                    param_data["value"].sort(key=pfunc)
-                else:
-                    param_data.sort(key=pfunc)
+            values = param_data["value"] if has_meta_data else param_data
+            before = list(values)
+            values.sort(key=keyfunc)
+
+            # Sorting this instance's value objects in place moves them out
+            # from under the indices stored in the search tree.
+            if (
+                param in own_data
+                and values is own_data[param]["value"]
+                and any(a is not b for a, b in zip(before, values))
+            ):
+                self._search_trees.pop(param, None)
+                self._value_index.pop(param, None)
+                self._data_version += 1
 
-            # Only update attributes when array first is off, since
-            # value order will not affect how arrays are constructed.
-            if update_attrs and has_meta_data and not self.array_first:
-                setattr(self, param, param_data["value"])
+            if update_attrs:
+                setattr(self, param, values)
@@ -1,3 +1,5 @@
+import functools
+import sys
 from collections import defaultdict
 
 from marshmallow import (
@@ -79,7 +81,8 @@ class BaseParamSchema(Schema):
         "title": str,
         "description": str,
         "notes": str,
-        "type": str (limited to 'int', 'float', 'bool', 'str'),
+        "type": str (limited to 'int', 'float', 'float32', 'bool', 'str',
+            'date'),
         "value": `BaseValidatorSchema`, "value" type depends on "type" key,
         "range": range schema ({"min": ..., "max": ..., "other ops": ...}),
     }
@@ -94,7 +97,7 @@ class BaseParamSchema(Schema):
     _type = fields.Str(
         required=True,
         validate=validate.OneOf(
-            choices=["str", "float", "int", "bool", "date"]
+            choices=["str", "float", "float32", "int", "bool", "date"]
         ),
         attribute="type",
         data_key="type",
@@ -133,10 +136,9 @@ class ValueObject(fields.Nested):
     def _deserialize(
         self, value, attr, data, partial=None, many=False, **kwargs
     ):
+        # lists of value objects, the normalized form, pass straight through.
         if not isinstance(value, list) or (
-            isinstance(value, list)
-            and value
-            and not isinstance(value[0], dict)
+            value and not isinstance(value[0], dict)
         ):
             value = [{"value": value}]
         return super()._deserialize(
@@ -173,12 +175,25 @@ class BaseValidatorSchema(Schema):
         "when": "_get_when_validator",
     }
 
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # resolve WRAPPER_MAP to bound methods once per instance.
+        self._wrappers = {
+            vname: getattr(self, method_name)
+            for vname, method_name in self.WRAPPER_MAP.items()
+        }
+        # per-load caches, cleared when load returns.
+        self._label_index = {}
+        self._resolve_cache = {}
+
     def load(self, data, ignore_warnings):
         self.ignore_warnings = ignore_warnings
         try:
             return super().load(data)
         finally:
             self.ignore_warnings = False
+            self._label_index = {}
+            self._resolve_cache = {}
 
     @validates_schema
     def validate_params(self, data, **kwargs):
@@ -188,33 +203,58 @@ class BaseValidatorSchema(Schema):
         parameters have been validated. Note that all data has been
         type-validated. These methods only do range validation.
         """
-        warnings = defaultdict(dict)
-        errors = defaultdict(dict)
+        # warnings and errors are only allocated once there is one to report.
+        warnings = None
+        errors = None
+        # Validators that do not depend on the value object being validated
+        # are built once per call and shared across value objects.
+        compiled = {}
+        spec_data = self.context["spec"]._data
         for name, specs in data.items():
+            # nothing to check for parameters without validators.
+            if not spec_data[name]["validators"]:
+                continue
             for i, spec in enumerate(specs):
-                _warnings, _errors = self.validate_param(name, spec, data)
+                _warnings, _errors = self.validate_param(
+                    name, spec, data, compiled=compiled
+                )
                 if _warnings:
+                    if warnings is None:
+                        warnings = defaultdict(dict)
                     warnings[name][i] = {"value": _warnings}
                 if _errors:
+                    if errors is None:
+                        errors = defaultdict(dict)
                     errors[name][i] = {"value": _errors}
         if warnings and not self.ignore_warnings:
+            if errors is None:
+                errors = defaultdict(dict)
             errors["warnings"] = warnings
         if errors:
             ve = MarshmallowValidationError(dict(errors))
             raise ve
 
-    def validate_param(self, param_name, param_spec, raw_data):
+    def validate_param(self, param_name, param_spec, raw_data, compiled=None):
         """
-        Do range validation for a parameter.
+        Do range validation for a parameter. Validators that can be shared
+        across value objects are stored in and reused from `compiled`.
         """
         param_info = self.context["spec"]._data[param_name]
         # sort keys to guarantee order.
         validator_spec = param_info["validators"]
         validators = []
         for vname, vdata in validator_spec.items():
-            validator = getattr(self, self.WRAPPER_MAP[vname])(
-                vname, vdata, param_name, param_spec, raw_data
-            )
+            validator = None
+            if compiled is not None:
+                validator = compiled.get((param_name, vname))
+            if validator is None:
+                validator = self._wrappers[vname](
+                    vname, vdata, param_name, param_spec, raw_data
+                )
+                if compiled is not None and self._is_static_validator(
+                    vname, vdata
+                ):
+                    compiled[(param_name, vname)] = validator
             validators.append(validator)
 
         warnings = []
@@ -230,6 +270,21 @@ class BaseValidatorSchema(Schema):
 
         return warnings, errors
 
+    def _is_static_validator(self, vname, vdata):
+        """
+        Range validators whose bounds are plain values do not depend on
+        the labels of the value object that is being validated.
+        """
+        if vname not in ("range", "date_range"):
+            return False
+        for op in ("min", "max"):
+            op_value = vdata.get(op, None)
+            if op_value is not None and (
+                op_value in self.fields or op_value == "default"
+            ):
+                return False
+        return True
+
     def _get_when_validator(
         self,
         vname,
@@ -252,33 +307,41 @@ class BaseValidatorSchema(Schema):
         oth_param, when_vos = self._resolve_op_value(
             when_param, param_name, param_spec, raw_data
         )
-        then_validators = []
-        for vname, vdata in when_dict["then"].items():
-            then_validators.append(
-                getattr(self, self.WRAPPER_MAP[vname])(
-                    vname,
-                    vdata,
-                    param_name,
-                    param_spec,
-                    raw_data,
-                    ndim_restriction=True,
-                )
-            )
-        otherwise_validators = []
-        for vname, vdata in when_dict["otherwise"].items():
-            otherwise_validators.append(
-                getattr(self, self.WRAPPER_MAP[vname])(
-                    vname,
-                    vdata,
-                    param_name,
-                    param_spec,
-                    raw_data,
-                    ndim_restriction=True,
-                )
-            )
 
-        _type = self.context["spec"]._data[oth_param]["type"]
-        number_dims = self.context["spec"]._data[oth_param]["number_dims"]
+        def lazy_validators(validators_spec):
+            """
+            Defer building the validators of a branch until When uses the
+            branch.
+            """
+
+            def build():
+                try:
+                    return [
+                        self._wrappers[vname](
+                            vname,
+                            vdata,
+                            param_name,
+                            param_spec,
+                            raw_data,
+                            ndim_restriction=True,
+                        )
+                        for vname, vdata in validators_spec.items()
+                    ]
+                except contrib.validate.ValidationError as ve:
+                    # Errors in the validators' definitions are schema
+                    # errors, not errors in the value being validated.
+                    raise MarshmallowValidationError(ve.messages)
+
+            return build
+
+        then_validators = lazy_validators(when_dict["then"])
+        otherwise_validators = lazy_validators(when_dict["otherwise"])
+
+        when_data = self.context["spec"]._data[
+            param_name if oth_param == "default" else oth_param
+        ]
+        _type = when_data["type"]
+        number_dims = when_data["number_dims"]
 
         error_then = (
             f"When {oth_param}{{when_labels}}{{ix}} is {{is_val}}, "
@@ -353,14 +416,13 @@ class BaseValidatorSchema(Schema):
     def _sort_by_label_to_extend(self, vos):
         label_to_extend = self.context["spec"].label_to_extend
         if label_to_extend is not None:
-            label_grid = self.context["spec"]._stateless_label_grid
-            extend_vals = label_grid[label_to_extend]
+            grid_ix = self.context["spec"]._stateless_label_grid_ix
+            extend_ix = grid_ix[label_to_extend]
             return sorted(
                 vos,
                 key=lambda vo: (
-                    extend_vals.index(vo[label_to_extend])
+                    extend_ix.get(vo[label_to_extend], 9e99)
                     if label_to_extend in vo
-                    and vo[label_to_extend] in extend_vals
                     else 9e99
                 ),
             )
@@ -405,9 +467,26 @@ class BaseValidatorSchema(Schema):
         variable.
         """
         if op_value in self.fields or op_value == "default":
-            return self._get_comparable_value(
-                op_value, param_name, param_spec, raw_data
-            )
+            # value objects with the same labels resolve to the same values
+            # for the rest of this load.
+            try:
+                key = (
+                    op_value,
+                    param_name,
+                    frozenset(
+                        (k, v) for k, v in param_spec.items() if k != "value"
+                    ),
+                )
+                return self._resolve_cache[key]
+            except TypeError:
+                return self._get_comparable_value(
+                    op_value, param_name, param_spec, raw_data
+                )
+            except KeyError:
+                res = self._resolve_cache[key] = self._get_comparable_value(
+                    op_value, param_name, param_spec, raw_data
+                )
+                return res
         return "", [{"value": op_value}]
 
     def _get_comparable_value(
@@ -433,14 +512,43 @@ class BaseValidatorSchema(Schema):
             vals = oth_param["value"]
         labs_to_check = {k for k in param_spec if k != "value"}
         if labs_to_check:
-            res = [
+            res = self._select_by_labels(vals, param_spec, labs_to_check)
+        else:
+            res = vals
+        return oth_param_name, res
+
+    def _select_by_labels(self, vals, param_spec, labs_to_check):
+        """
+        Select the value objects in vals whose labels match those in
+        param_spec. The first search of vals during a load indexes its
+        value objects by their labels, and later searches reuse the index.
+        """
+        labs = tuple(sorted(labs_to_check))
+        key = (id(vals), labs)
+        entry = self._label_index.get(key)
+        if entry is None:
+            index = {}
+            try:
+                for val in vals:
+                    index.setdefault(tuple(val[k] for k in labs), []).append(
+                        val
+                    )
+            except (KeyError, TypeError):
+                # missing or unhashable labels: fall back to a scan.
+                index = None
+            # keep a reference to vals so that its id is not reused.
+            entry = self._label_index[key] = (vals, index)
+        index = entry[1]
+        if index is None:
+            return [
                 val
                 for val in vals
                 if all(val[k] == param_spec[k] for k in labs_to_check)
             ]
-        else:
-            res = vals
-        return oth_param_name, res
+        try:
+            return list(index.get(tuple(param_spec[k] for k in labs), ()))
+        except TypeError:
+            return []
 
     def _check_ndim_restriction(
         self, param_name, *other_params, ndim_restriction=False
@@ -552,24 +660,65 @@ VALIDATOR_MAP = {
 }
 
 
+def _str_choices(data):
+    """
+    Get the choices of a "str" parameter if they are enforced by a "choice"
+    validator with level "error". Adjustments outside of these choices are
+    rejected, so the choices can be used to size a fixed width string dtype.
+    Default values are not validated against the choices, so None is
+    returned if one of them is longer than the longest choice. Such a value
+    would be truncated in a fixed width array.
+    """
+    choice = data.get("validators", {}).get("choice")
+    if not choice or choice.get("level", "error") != "error":
+        return None
+    choices = tuple(choice["choices"])
+    width = max((len(c) for c in choices if isinstance(c, str)), default=0)
+    values = data.get("value")
+    if isinstance(values, list) and values and isinstance(values[0], dict):
+        values = [vo.get("value") for vo in values]
+    if any(
+        isinstance(value, str) and len(value) > width
+        for value in utils.get_leaves(values)
+    ):
+        return None
+    return choices
+
+
 def get_type(data):
     numeric_types = {
-        "int": contrib.fields.Int64(
-            allow_none=True, error_messages=INVALID_NUMBER
-        ),
-        "bool": contrib.fields.Bool_(
-            allow_none=True, error_messages=INVALID_BOOLEAN
-        ),
-        "float": contrib.fields.Float64(
-            allow_none=True, error_messages=INVALID_NUMBER
-        ),
+        "int": (contrib.fields.Int64, INVALID_NUMBER),
+        "bool": (contrib.fields.Bool_, INVALID_BOOLEAN),
+        "float": (contrib.fields.Float64, INVALID_NUMBER),
+        "float32": (contrib.fields.Float32, INVALID_NUMBER),
     }
-    types = dict(FIELD_MAP, **numeric_types)
-    fieldtype = types[data["type"]]
+    if data["type"] in numeric_types:
+        field_class, error_messages = numeric_types[data["type"]]
+        fieldtype = contrib.fields.make_field(
+            field_class, allow_none=True, error_messages=error_messages
+        )
+    elif data["type"] == "str" and _str_choices(data):
+        fieldtype = contrib.fields.make_field(
+            contrib.fields.Str, allow_none=True, choices=_str_choices(data)
+        )
+    else:
+        fieldtype = FIELD_MAP[data["type"]]
     dim = data.get("number_dims", 0)
+    if dim > 0:
+        return _list_field(fieldtype, dim)
+    return fieldtype
+
+
+@functools.lru_cache(maxsize=1024)
+def _list_field(fieldtype, dim):
+    """
+    Wrap fieldtype in dim nested List fields. Parameters with the same type
+    and number of dimensions share their field. Like the fields returned by
+    make_field, these must not be modified.
+    """
     while dim > 0:
-        np_type = getattr(fieldtype, "np_type", object)
-        fieldtype = fields.List(fieldtype, allow_none=True)
+        np_type = contrib.fields.get_np_type(fieldtype)
+        fieldtype = contrib.fields.List(fieldtype, allow_none=True)
         fieldtype.np_type = np_type
         dim -= 1
     return fieldtype
@@ -603,6 +752,7 @@ def get_param_schema(base_spec, field_map=None):
     )
     label_validators = {}
     for name, label in base_spec["labels"].items():
+        name = sys.intern(name)
         validators = []
         for vname, kwargs in label["validators"].items():
             validator_class = VALIDATOR_MAP[vname]
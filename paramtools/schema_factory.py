@@ -1,3 +1,5 @@
+import sys
+
 from marshmallow import fields
 
 from paramtools.schema import (
@@ -28,7 +30,11 @@ class SchemaFactory:
 
     def __init__(self, defaults, field_map={}):
         defaults = utils.read_json(defaults)
-        self.defaults = {k: v for k, v in defaults.items() if k != "schema"}
+        # parameter names are used as dict keys everywhere; intern them so
+        # that lookups can short-circuit on identity.
+        self.defaults = {
+            sys.intern(k): v for k, v in defaults.items() if k != "schema"
+        }
         self.schema = ParamToolsSchema().load(defaults.get("schema", {}))
         (self.BaseParamSchema, self.label_validators) = get_param_schema(
             self.schema, field_map=field_map
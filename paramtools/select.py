@@ -3,6 +3,7 @@ from typing import Any, Iterable, List
 
 from paramtools.tree import Tree
 from paramtools.typing import ValueObject, CmpFunc
+from paramtools.utils import grid_index
 
 
 def select(
@@ -40,9 +41,26 @@ def gt_func(x: Any, y: Iterable) -> bool:
     return all(x > item for item in y)
 
 
-def gt_ix_func(cmp_list: list, x: Any, y: Iterable) -> bool:
-    x_val = cmp_list.index(x)
-    return all(x_val > cmp_list.index(item) for item in y)
+def gt_ix_func(
+    cmp_list: list, x: Any, y: Iterable, cmp_ix: dict = None
+) -> bool:
+    """
+    Check whether x comes after every item in y in cmp_list. cmp_ix is an
+    optional map of each value in cmp_list to its position; values
+    missing from it are looked up in cmp_list.
+    """
+    if cmp_ix is None:
+        x_val = cmp_list.index(x)
+        return all(x_val > cmp_list.index(item) for item in y)
+
+    def position(item):
+        try:
+            return cmp_ix[item]
+        except (KeyError, TypeError):
+            return cmp_list.index(item)
+
+    x_val = position(x)
+    return all(x_val > position(item) for item in y)
 
 
 def select_eq(
@@ -70,10 +88,11 @@ def select_gt_ix(
     cmp_list: List,
     tree: Tree = None,
 ) -> List[ValueObject]:
+    cmp_ix = grid_index(cmp_list)
     return select(
         value_objects,
         exact_match,
-        lambda x, y: gt_ix_func(cmp_list, x, y),
+        lambda x, y: gt_ix_func(cmp_list, x, y, cmp_ix),
         labels,
         tree,
     )
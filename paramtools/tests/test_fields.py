@@ -1,6 +1,9 @@
+import copy
 import datetime
 
 import numpy as np
+import marshmallow as ma
+import pytest
 
 from paramtools.contrib import fields, validate
 
@@ -11,12 +14,19 @@ def test_np_value_fields():
     assert res == 2.0
     assert isinstance(res, np.float64)
     assert type(float64._serialize(res, None, None)) == float
+    assert float64._serialize(np.array(2.0), None, None) == 2.0
+    assert float64._serialize(np.array([1.0, 2.0]), None, None) == [1.0, 2.0]
+    assert float64._serialize(2.0, None, None) == 2.0
 
     int64 = fields.Int64()
     res = int64._deserialize("2", None, None)
     assert res == 2
     assert isinstance(res, np.int64)
     assert type(int64._serialize(res, None, None)) == int
+    with pytest.raises(ma.ValidationError):
+        int64._deserialize("abc", None, None)
+    with pytest.raises(ma.ValidationError):
+        int64._deserialize(True, None, None)
 
     bool_ = fields.Bool_()
     res = bool_._deserialize("true", None, None)
@@ -36,6 +46,11 @@ def test_contrib_fields():
     assert s.grid() == ["one", "two"]
     s = fields.Str()
     assert s.grid() == []
+    assert s.np_type == object
+    s = fields.Str(validate=[choice_validator])
+    assert s.np_type == np.dtype("U3")
+    s = fields.Str(choices=["a", "bbb", "cc"])
+    assert s.np_type == np.dtype("U3")
 
     s = fields.Integer(validate=[range_validator])
     assert s.grid() == [0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10]
@@ -48,3 +63,123 @@ def test_contrib_fields():
 
     s = fields.Date()
     assert s._deserialize(datetime.date(2015, 1, 1), None, None)
+    assert s._deserialize("2015-01-01", None, None) == datetime.date(
+        2015, 1, 1
+    )
+    with pytest.raises(ma.ValidationError):
+        s._deserialize("2015-13-01", None, None)
+
+
+def test_bound_methods_rebound_on_copy():
+    float64 = fields.Float64()
+    float64_copy = copy.deepcopy(float64)
+    assert float64_copy._serialize.__self__ is float64_copy
+    assert float64_copy._deserialize.__self__ is float64_copy
+    assert float64_copy._deserialize("2", None, None) == 2.0
+
+
+def test_deserialize_many():
+    float64 = fields.Float64()
+    res = float64._deserialize_many(["1", 2, 3.5])
+    assert res == [1.0, 2.0, 3.5]
+    assert all(isinstance(r, np.float64) for r in res)
+    assert float64._deserialize_many([1, None]) is None
+    assert float64._deserialize_many([1, True]) is None
+    assert float64._deserialize_many(["abc"]) is None
+
+    int64 = fields.Int64()
+    res = int64._deserialize_many([1, "2"])
+    assert res == [1, 2]
+    assert all(isinstance(r, np.int64) for r in res)
+
+
+def test_list_field():
+    list_field = fields.List(fields.Float64(allow_none=True))
+    res = list_field.deserialize(["1", 2])
+    assert res == [1.0, 2.0]
+    assert all(isinstance(r, np.float64) for r in res)
+    assert list_field.deserialize([1, None]) == [1.0, None]
+    with pytest.raises(ma.ValidationError) as excinfo:
+        list_field.deserialize([1, "abc"])
+    assert list(excinfo.value.messages) == [1]
+
+
+def test_fast_cast():
+    res = fields.Float64._fast_cast(np.array([1, 2]))
+    assert res == [1.0, 2.0]
+    assert all(isinstance(r, np.float64) for r in res)
+    assert fields.Int64._fast_cast(np.array([1.0, np.nan])) is None
+    assert fields.Int64._fast_cast(np.array([True, False])) is None
+    assert fields.Float64._fast_cast(np.array([[1.0], [2.0]])) is None
+
+    list_field = fields.List(fields.Int64())
+    assert list_field.deserialize(np.array([1.0, 2.0])) == [1, 2]
+
+
+def test_get_np_type():
+    assert fields.get_np_type(fields.Float64()) == np.float64
+    assert fields.get_np_type(fields.Str()) == object
+    list_field = fields.List(fields.Int64())
+    list_field.np_type = np.int64
+    assert fields.get_np_type(list_field) == np.int64
+    assert fields.get_np_type(ma.fields.Field()) == object
+
+
+def test_make_field():
+    error_messages = {"invalid": "Not a valid number: {input}."}
+    field = fields.make_field(
+        fields.Float64, allow_none=True, error_messages=error_messages
+    )
+    assert field is fields.make_field(
+        fields.Float64, allow_none=True, error_messages=dict(error_messages)
+    )
+    assert field is not fields.make_field(fields.Float64)
+    assert field is not fields.make_field(fields.Int64, allow_none=True)
+    assert isinstance(field, fields.Float64)
+    assert field.allow_none
+
+
+def test_serialize_bulk():
+    float64 = fields.Float64()
+    res = float64._serialize_bulk([np.float64(1), np.float64(2.5)])
+    assert res == [1.0, 2.5]
+    assert all(type(r) == float for r in res)
+    assert float64._serialize_bulk(np.array([1.0, 2.5])) == [1.0, 2.5]
+    assert float64._serialize_bulk([np.float64(1), None]) is None
+
+    list_field = fields.List(fields.Bool_(allow_none=True))
+    assert list_field.serialize("v", {"v": [np.bool_(True)]}) == [True]
+    assert list_field.serialize("v", {"v": [np.bool_(True), None]}) == [
+        True,
+        None,
+    ]
+
+
+def test_scalar_cache():
+    float64 = fields.Float64()
+    assert float64._deserialize(1, None, None) is float64._deserialize(
+        1.0, None, None
+    )
+    assert isinstance(float64._deserialize(1, None, None), np.float64)
+    assert float64._deserialize(0.25, None, None) == 0.25
+
+    int64 = fields.Int64()
+    assert int64._deserialize(2, None, None) is int64._deserialize(
+        2, None, None
+    )
+    assert isinstance(int64._deserialize(2, None, None), np.int64)
+    assert int64._deserialize(1000, None, None) == 1000
+    with pytest.raises(ma.ValidationError):
+        int64._deserialize(True, None, None)
+
+
+def test_bool_deserialize_many():
+    bool_ = fields.Bool_()
+    res = bool_._deserialize_many(["true", False, 1, "0"])
+    assert res == [True, False, True, False]
+    assert all(isinstance(r, np.bool_) for r in res)
+    assert bool_._deserialize_many([True, None]) is None
+    assert bool_._deserialize_many([True, "maybe"]) is None
+
+    list_field = fields.List(fields.Bool_(allow_none=True))
+    assert list_field.deserialize(["true", None]) == [True, None]
@@ -72,6 +72,20 @@ def test_init(TestParams):
     assert params.label_grid == params._stateless_label_grid
 
 
+def test_schema_cache(TestParams):
+    params1 = TestParams()
+    params2 = TestParams()
+    assert params1._defaults_schema is params2._defaults_schema
+    assert params1._validator_schema is not params2._validator_schema
+    assert params1._validator_schema.context["spec"] is params1
+    assert params2._validator_schema.context["spec"] is params2
+    assert params1._data is not params2._data
+
+    params1.adjust({"min_int_param": [{"value": 3}]})
+    assert params1._data != params2._data
+    assert params2._data == TestParams()._data
+
+
 class TestSchema:
     def test_empty_schema(self):
         class Params(Parameters):
@@ -313,6 +327,78 @@ class TestAccess:
             params._defaults_schema.load(exp)
         )
 
+    def test_serializable_cache(self, TestParams):
+        params = TestParams()
+        spec1 = params.specification(serializable=True)
+        spec2 = params.specification(serializable=True)
+        assert spec1 == spec2
+        assert spec1 is not spec2
+
+        # Mutating a returned specification does not affect the cache.
+        spec1.pop("min_int_param")
+        assert "min_int_param" in params.specification(serializable=True)
+
+        params.adjust({"min_int_param": [{"label0": "one", "value": 3}]})
+        spec3 = params.specification(serializable=True)
+        assert spec3 != spec2
+        assert {"label0": "one", "label1": 2, "value": 3} in spec3[
+            "min_int_param"
+        ]
+
+    def test_serializable_cache_nested_mutation(self, TestParams):
+        params = TestParams()
+        dumped = params.dump()
+        exp = copy.deepcopy(dumped)
+
+        # Mutating nested data in returned results does not affect the cache.
+        dumped["min_int_param"]["value"].clear()
+        dumped["max_int_param"]["value"][0]["value"] = 999
+        dumped["max_int_param"]["title"] = "changed"
+        assert params.dump() == exp
+
+        spec = params.specification(serializable=True, meta_data=True)
+        spec["min_int_param"]["value"][0]["value"] = 999
+        spec["min_int_param"]["title"] = "changed"
+        spec = params.specification(serializable=True)
+        spec["min_int_param"][0]["value"] = 999
+        spec["min_int_param"].clear()
+        assert params.dump() == exp
+        assert params.specification(serializable=True) == {
+            param: data["value"]
+            for param, data in exp.items()
+            if param != "schema" and data["value"]
+        }
+
+    def test_serializable_cache_direct_edits(self, TestParams):
+        """
+        Value objects edited in place are not seen by cached serializable
+        results until the data is changed through the instance.
+        """
+        params = TestParams()
+        before = params.specification(serializable=True)
+        params._data["min_int_param"]["value"][0]["value"] = 0
+        assert params.specification(serializable=True) == before
+
+        params.adjust({"max_int_param": [{"label0": "zero", "value": 5}]})
+        spec = params.specification(serializable=True)
+        assert spec["min_int_param"][0]["value"] == 0
+        assert spec["max_int_param"][0]["value"] == 5
+
+    def test_validator_schema_reused(self, TestParams):
+        params = TestParams()
+        validator_schema = params._validator_schema
+        params.adjust({"min_int_param": [{"label0": "one", "value": 3}]})
+        params.adjust(
+            {"min_int_param": [{"label0": "one", "value": -1}]},
+            raise_errors=False,
+        )
+        assert params.errors
+        assert params._validator_schema is validator_schema
+        assert params._validator_schema.context["spec"] is params
+
+        # Instances built from the cached schemas get their own validator.
+        assert TestParams()._validator_schema is not validator_schema
+
     def test_dump(self, TestParams, defaults_spec_path):
         params1 = TestParams()
         spec = params1.specification(serializable=True, meta_data=True)
@@ -476,6 +562,19 @@ class TestAccess:
             sort_values=True
         )
 
+    def test_select_after_sort_values(self, TestParams):
+        """Ensure cached search trees follow in-place sorts"""
+        params = TestParams()
+        exp = params.select_eq("min_int_param", False, label0="zero")
+        shuffle(params._data["min_int_param"]["value"])
+        params._search_trees.clear()
+        params.select_eq("min_int_param", False, label0="zero")
+        params.sort_values()
+        res = params.select_eq("min_int_param", False, label0="zero")
+        assert sorted(map(str, res)) == sorted(map(str, exp))
+        for vo in res:
+            assert vo["label0"] == "zero"
+
     def test_sort_values_w_array(self, extend_ex_path):
         """Test sort values with array first config"""
 
@@ -520,6 +619,27 @@ class TestAdjust:
         assert params.min_int_param == adjustment["min_int_param"]
         assert params.max_int_param == adjustment["max_int_param"]
 
+    def test_adjust_compared_by_labels(self, TestParams):
+        """
+        Each value object is compared against the reference param's value
+        object with the same labels.
+        """
+        params = TestParams()
+        adjustment = {
+            "min_int_param": [
+                {"label0": "zero", "label1": 1, "value": 10},
+                {"label0": "one", "label1": 2, "value": 11},
+                {"label0": "one", "label1": 1, "value": 1},
+            ]
+        }
+        params.adjust(adjustment, raise_errors=False)
+        assert params.errors["min_int_param"] == [
+            "min_int_param[label0=zero, label1=1] 10 > max 3 "
+            "max_int_param[label0=zero, label1=1]",
+            "min_int_param[label0=one, label1=2] 11 > max 4 "
+            "max_int_param[label0=one, label1=2]",
+        ]
+
     def test_adjust_many_labels(self, TestParams):
         """
         Adjust min_int_param above original max_int_param value at same time as
@@ -785,6 +905,47 @@ class TestValidationMessages:
 
         assert params.errors["float_list_param"] == exp
 
+    def test_type_validation_on_list_param(self, TestParams):
+        """
+        Type errors on list params are keyed by the index of the bad item,
+        unlike the range errors above. Both shapes occur for the same param.
+        """
+        params = TestParams()
+        adj = {
+            "float_list_param": [
+                {"value": ["abc", 1, "def"], "label0": "zero", "label1": 1}
+            ]
+        }
+        params.adjust(adj, raise_errors=False)
+        exp = ["Not a valid number: abc.", "Not a valid number: def."]
+
+        assert params.errors["float_list_param"] == exp
+        assert params._errors["labels"]["float_list_param"] == [
+            {"label0": "zero", "label1": 1}
+        ]
+
+    def test_parse_errors_skips_empty_messages(self, TestParams):
+        params = TestParams()
+        adj = {
+            "min_int_param": [
+                {"label0": "zero", "label1": 1, "value": 1},
+                {"label0": "one", "label1": 2, "value": "abc"},
+            ]
+        }
+        messages = {
+            "min_int_param": {
+                0: {"value": []},
+                1: {"value": ["Not a valid number: abc."]},
+            }
+        }
+        error_info = params._parse_errors(messages, adj)
+        assert error_info["messages"]["min_int_param"] == [
+            ["Not a valid number: abc."]
+        ]
+        assert error_info["labels"]["min_int_param"] == [
+            {"label0": "one", "label1": 2}
+        ]
+
     def test_warnings(self, TestParams):
         params = TestParams()
         with pytest.raises(ValidationError) as excinfo:
@@ -869,6 +1030,38 @@ class TestValidationMessages:
             "When when_param is less than 0, param value is invalid: param -1 < min 0 "
         ]
 
+    def test_when_validation_default(self):
+        class Params(Parameters):
+            defaults = {
+                "param": {
+                    "title": "",
+                    "description": "",
+                    "type": "int",
+                    "value": 0,
+                    "validators": {
+                        "when": {
+                            "param": "default",
+                            "is": {"less_than": 0},
+                            "then": {"range": {"min": 0}},
+                            "otherwise": {"range": {"max": 10}},
+                        }
+                    },
+                }
+            }
+
+        params = Params(array_first=True)
+        params.adjust({"param": 5})
+        assert params.param == 5
+
+        with pytest.raises(ValidationError) as excinfo:
+            params.adjust({"param": 11})
+
+        msg = json.loads(excinfo.value.args[0])
+        assert msg["errors"]["param"] == [
+            "When default is not less than 0, param value is invalid: "
+            "param 11 > max 10 "
+        ]
+
     def test_when_validation_limitations(self):
         """
         When validation prohibits child validators from doing referential violation
@@ -1275,6 +1468,87 @@ class TestArrayFirst:
             == exp
         )
 
+    def test_adjust_patches_arrays(self):
+        class AFParams(Parameters):
+            defaults = {
+                "schema": {
+                    "labels": {
+                        "d0": {
+                            "type": "int",
+                            "validators": {"range": {"min": 0, "max": 3}},
+                        },
+                        "d1": {
+                            "type": "str",
+                            "validators": {"choice": {"choices": ["a", "b"]}},
+                        },
+                    }
+                },
+                "param": {
+                    "title": "",
+                    "description": "",
+                    "type": "float",
+                    "value": [
+                        {"d0": d0, "d1": d1, "value": 1.0}
+                        for d0 in range(4)
+                        for d1 in ["a", "b"]
+                    ],
+                },
+            }
+
+        params = AFParams(array_first=True)
+        before = params.param
+        params.adjust(
+            {
+                "param": [
+                    {"d1": "a", "value": 2.0},
+                    {"d0": 2, "d1": "b", "value": 3.0},
+                ]
+            }
+        )
+        # The array is patched in a copy, not in place.
+        assert params.param is not before
+        assert before.tolist() == [[1.0, 1.0]] * 4
+        np.testing.assert_equal(params.param, params.to_array("param"))
+        assert params.param.tolist() == [
+            [2.0, 1.0],
+            [2.0, 1.0],
+            [2.0, 3.0],
+            [2.0, 1.0],
+        ]
+
+        params.set_state(d0=[1, 2])
+        params.adjust({"param": [{"d0": 0, "value": 4.0}, {"value": 5.0}]})
+        np.testing.assert_equal(params.param, params.to_array("param"))
+        assert params.param.tolist() == [[5.0, 5.0], [5.0, 5.0]]
+
+    def test_adjust_after_errors_does_not_patch_arrays(self):
+        class AFParams(Parameters):
+            defaults = {
+                "schema": {
+                    "labels": {
+                        "d0": {
+                            "type": "int",
+                            "validators": {"range": {"min": 0, "max": 3}},
+                        }
+                    }
+                },
+                "param": {
+                    "title": "",
+                    "description": "",
+                    "type": "int",
+                    "value": [{"d0": d0, "value": 1} for d0 in range(4)],
+                    "validators": {"range": {"min": 0, "max": 10}},
+                },
+            }
+
+        params = AFParams(array_first=True)
+        params.adjust({"param": [{"d0": 0, "value": 11}]}, raise_errors=False)
+        assert params.errors
+        # The errors from the first adjustment block this one, too.
+        params.adjust({"param": [{"d0": 1, "value": 5}]}, raise_errors=False)
+        assert params.param.tolist() == [1, 1, 1, 1]
+        np.testing.assert_equal(params.param, params.to_array("param"))
+
     def test_to_array_with_nd_lists(self):
         class ArrayAdjust(Parameters):
             defaults = {
@@ -1344,6 +1618,109 @@ class TestArrayFirst:
         assert params.mystring == "hello world"
         assert isinstance(params.mystring, str)
 
+    def test_array_first_float32(self):
+        class Float32Params(Parameters):
+            defaults = {
+                "myfloat": {
+                    "title": "my float",
+                    "description": "",
+                    "type": "float32",
+                    "number_dims": 1,
+                    "value": [0.5, 1.5],
+                    "validators": {"range": {"min": 0, "max": 2}},
+                }
+            }
+            array_first = True
+
+        params = Float32Params()
+        assert params.myfloat.dtype == np.float32
+        np.testing.assert_equal(params.myfloat, [0.5, 1.5])
+
+        params.adjust({"myfloat": [1, 2]})
+        assert params.myfloat.dtype == np.float32
+        np.testing.assert_equal(params.myfloat, [1.0, 2.0])
+        assert params.dump()["myfloat"]["value"] == [{"value": [1.0, 2.0]}]
+
+        with pytest.raises(ValidationError):
+            params.adjust({"myfloat": [1, 3]})
+
+    def test_array_first_str_choices(self):
+        class StrParams(Parameters):
+            defaults = {
+                "schema": {
+                    "labels": {
+                        "label0": {
+                            "type": "int",
+                            "validators": {"range": {"min": 0, "max": 1}},
+                        }
+                    }
+                },
+                "mystr": {
+                    "title": "my str",
+                    "description": "",
+                    "type": "str",
+                    "value": [
+                        {"label0": 0, "value": "a"},
+                        {"label0": 1, "value": "bbb"},
+                    ],
+                    "validators": {"choice": {"choices": ["a", "bbb"]}},
+                },
+                "mywarnstr": {
+                    "title": "my str",
+                    "description": "",
+                    "type": "str",
+                    "value": [
+                        {"label0": 0, "value": "a"},
+                        {"label0": 1, "value": "bbb"},
+                    ],
+                    "validators": {
+                        "choice": {"choices": ["a", "bbb"], "level": "warn"}
+                    },
+                },
+            }
+            array_first = True
+
+        params = StrParams()
+        assert params.mystr.dtype == np.dtype("U3")
+        assert params.mystr.tolist() == ["a", "bbb"]
+        assert params.mywarnstr.dtype == object
+
+    def test_array_first_str_default_outside_choices(self):
+        class StrParams(Parameters):
+            defaults = {
+                "schema": {
+                    "labels": {
+                        "label0": {
+                            "type": "int",
+                            "validators": {"range": {"min": 0, "max": 1}},
+                        }
+                    }
+                },
+                "mystr": {
+                    "title": "my str",
+                    "description": "",
+                    "type": "str",
+                    "value": [
+                        {"label0": 0, "value": "a"},
+                        {"label0": 1, "value": "abcdef"},
+                    ],
+                    "validators": {"choice": {"choices": ["a", "bbb"]}},
+                },
+            }
+            array_first = True
+
+        params = StrParams()
+        # Defaults are not validated against the choices; a longer default
+        # must not be truncated by a fixed width dtype.
+        assert params.mystr.dtype == object
+        assert params.mystr.tolist() == ["a", "abcdef"]
+        params.adjust({"mystr": [{"label0": 0, "value": "bbb"}]})
+        assert params.mystr.tolist() == ["bbb", "abcdef"]
+        assert params.from_array("mystr") == [
+            {"label0": 0, "value": "bbb"},
+            {"label0": 1, "value": "abcdef"},
+        ]
+
 
 class TestCollisions:
     def test_collision_list(self):
@@ -1860,3 +2237,37 @@ class TestIndex:
                     "indexed_param": [{"d0": 3, "value": 8}],
                 }
             )
+
+    @pytest.mark.parametrize(
+        "value,rates",
+        [
+            (100, [0.02, 0.03, 0.01]),
+            (-1234.567, [0.05] * 20),
+            (0.005, [0.5]),
+            (1e99, [-0.99, 0.01]),
+            (1, []),
+        ],
+    )
+    def test_shrink(self, value, rates):
+        from paramtools.parameters import _shrink
+
+        exp = value
+        for rate in reversed(rates):
+            v = exp * (1 + rate) ** -1
+            exp = np.round(v, 2) if v < 9e99 else 9e99
+        assert _shrink(value, rates) == exp
+
+    def test_round2(self):
+        from paramtools.parameters import _round2
+
+        rng = np.random.default_rng(0)
+        values = np.concatenate(
+            [
+                rng.uniform(-1e6, 1e6, 1000),
+                rng.uniform(-1, 1, 1000),
+                [0.005, 0.015, 0.125, -2.675, 1e300, 1e307, -1e307],
+            ]
+        )
+        with np.errstate(over="ignore"):
+            for v in values:
+                assert _round2(float(v)) == np.round(v, 2)
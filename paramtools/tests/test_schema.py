@@ -9,3 +9,10 @@ def test_get_type_with_list():
 
     list_int_field = get_type({"type": "int", "number_dims": 2})
     assert list_int_field.np_type == int_field.np_type
+
+
+def test_get_type_list_field_shared():
+    list_int_field = get_type({"type": "int", "number_dims": 2})
+    assert get_type({"type": "int", "number_dims": 2}) is list_int_field
+    assert get_type({"type": "int", "number_dims": 1}) is not list_int_field
+    assert get_type({"type": "float", "number_dims": 2}) is not list_int_field
@@ -1,6 +1,6 @@
 import pytest
 
-from paramtools.select import select_eq, select_gt
+from paramtools.select import select_eq, select_gt, select_gt_ix
 
 
 @pytest.fixture
@@ -31,3 +31,15 @@ def test_select_gt(vos):
         {"d0": 2, "d1": "hello", "value": 1},
         {"d0": 3, "d1": "world", "value": 1},
     ]
+
+
+def test_select_gt_ix(vos):
+    cmp_list = [3, 1, 2]
+    res = select_gt_ix(vos, True, {"d0": 1}, cmp_list)
+    assert sorted(vo["d0"] for vo in res) == [2]
+
+    res = select_gt_ix(vos, True, {"d0": 3}, cmp_list)
+    assert sorted(vo["d0"] for vo in res) == [1, 1, 2]
+
+    with pytest.raises(ValueError):
+        select_gt_ix(vos, True, {"d0": 4}, cmp_list)
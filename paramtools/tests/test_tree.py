@@ -63,6 +63,63 @@ def test_update_simple(vos, label_grid):
     assert_rebalanced(tree)
 
 
+def test_update_no_match_after_empty_intersection(label_grid):
+    vos = [
+        {"d0": 1, "d1": "hello", "d2": 0, "value": 1},
+        {"d0": 2, "d1": "world", "d2": 0, "value": 1},
+    ]
+    tree = Tree(vos, label_grid)
+    # d0 and d1 match different value objects. The d2 match must not
+    # revive the empty intersection.
+    new_vos = [{"d0": 1, "d1": "world", "d2": 0, "value": 2}]
+    tree.update(Tree(new_vos, label_grid))
+    assert tree.vos == [
+        {"d0": 1, "d1": "hello", "d2": 0, "value": 1},
+        {"d0": 2, "d1": "world", "d2": 0, "value": 1},
+        {"d0": 1, "d1": "world", "d2": 0, "value": 2},
+    ]
+    assert_rebalanced(tree)
+
+
+def test_update_unmatched_labels(label_grid):
+    vos = [{"d0": 1, "d1": "hello", "value": 1}]
+    tree = Tree(vos, label_grid)
+    # Both label values are missing from the tree.
+    new_vos = [{"d0": 2, "d1": "world", "value": 2}]
+    tree.update(Tree(new_vos, label_grid))
+    assert tree.vos == [
+        {"d0": 1, "d1": "hello", "value": 1},
+        {"d0": 2, "d1": "world", "value": 2},
+    ]
+    assert_rebalanced(tree)
+
+
+@pytest.mark.parametrize(
+    "new_vo",
+    [
+        {"d0": 1, "d1": "hello", "value": 2},
+        {"d0": 1, "value": 2},
+        {"d0": 3, "d1": "hello", "value": 2},
+        {"d0": 1, "d1": "world", "value": None},
+        {"d1": "world", "value": None},
+        {"d0": 3, "d1": "world", "value": None},
+    ],
+)
+def test_update_one(vos, label_grid, new_vo):
+    tree = Tree(copy.deepcopy(vos), label_grid)
+    exp = Tree(copy.deepcopy(vos), label_grid)
+    exp.update(Tree([dict(new_vo)], label_grid))
+    tree.update_one(dict(new_vo))
+    assert tree.vos == exp.vos
+    assert_rebalanced(tree)
+
+
+def test_update_one_error_on_extra_label(vos, label_grid):
+    tree = Tree(vos, label_grid)
+    with pytest.raises(ParamToolsError):
+        tree.update_one({"d0": 1, "d2": 0, "value": 2})
+
+
 def test_update_all(vos, label_grid):
     tree = Tree(vos, label_grid)
     new_vos = [
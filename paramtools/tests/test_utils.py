@@ -1,3 +1,5 @@
+import pytest
+
 from paramtools import (
     get_leaves,
     ravel,
@@ -7,6 +9,7 @@ from paramtools import (
     filter_labels,
     make_label_str,
 )
+from paramtools.utils import grid_index, grid_sort, load_json
 
 
 def test_get_leaves():
@@ -95,3 +98,26 @@ def test_make_label_str():
     assert make_label_str({"value": 0}) == ""
     assert make_label_str({}) == ""
     assert make_label_str({"b": 0, "c": 1, "a": 2}) == "[a=2, b=0, c=1]"
+
+
+def test_grid_index():
+    assert grid_index([2013, 2014, 2015]) == {2013: 0, 2014: 1, 2015: 2}
+    assert grid_index(["a", "b", "a"]) == {"a": 0, "b": 1}
+    assert grid_index([]) == {}
+
+
+def test_grid_sort():
+    grid = [2013, 2014, 2015]
+    vos = [{"year": 2015}, {"year": 2013}, {"year": 2014}]
+    exp = [{"year": 2013}, {"year": 2014}, {"year": 2015}]
+    assert grid_sort(vos, "year", grid) == exp
+    assert grid_sort(vos, "year", grid, grid_index(grid)) == exp
+
+
+def test_load_json():
+    assert load_json('{"a": [1, 2.5, "b"]}') == {"a": [1, 2.5, "b"]}
+    assert load_json(b'{"a": [{"value": 1}]}') == {"a": [{"value": 1}]}
+    res = load_json('{"a": NaN}')
+    assert res["a"] != res["a"]
+    with pytest.raises(ValueError):
+        load_json("{not json")
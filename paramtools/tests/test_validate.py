@@ -143,6 +143,31 @@ def test_When():
     assert when.grid() == list(range(10 + 1))
 
 
+def test_When_lazy_validators():
+    built = []
+
+    def then_validators():
+        built.append("then")
+        return [Range(0, 10)]
+
+    def otherwise_validators():
+        built.append("otherwise")
+        return [OneOf(choices=[12, 15])]
+
+    when = When(
+        {"equal_to": "hello"},
+        when_vos=[{"value": "hello"}],
+        then_validators=then_validators,
+        otherwise_validators=otherwise_validators,
+    )
+
+    when(3)
+    with pytest.raises(ValidationError):
+        when(12)
+    # only the branch that was used is built, and only once.
+    assert built == ["then"]
+
+
 def test_level():
     oneof = OneOf(choices=["allowed1", "allowed2"], level="warn")
     assert oneof.level == "warn"
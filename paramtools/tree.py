@@ -124,7 +124,8 @@ class Tree:
         else:
             # search_hits saves the intersection of all label matches.
             # The indices in the sets at the end are the search hits.
-            search_hits = {ix: set([]) for ix in range(len(tree.vos))}
+            # None means that no label has been matched yet.
+            search_hits = {ix: None for ix in range(len(tree.vos))}
             for label in self.label_grid:
                 if label in tree.tree and label in self.tree:
                     # All label values that exist in both trees.
@@ -133,14 +134,14 @@ class Tree:
                     ):
                         for new_ix in tree.tree[label][label_value]:
                             if new_ix in search_hits:
-                                if search_hits[new_ix]:
+                                if search_hits[new_ix] is not None:
                                     search_hits[new_ix] &= self.tree[label][
                                         label_value
                                     ]
                                 else:
-                                    search_hits[new_ix] |= self.tree[label][
-                                        label_value
-                                    ]
+                                    search_hits[new_ix] = set(
+                                        self.tree[label][label_value]
+                                    )
                     # All label values in the new tree that are not in this tree.
                     # Value objects that have a label value that is not included
                     # in the current tree means that they will not be matched.
@@ -148,17 +149,17 @@ class Tree:
                         tree.tree[label].keys() - self.tree[label].keys()
                     ):
                         for new_ix in tree.tree[label][label_value]:
-                            search_hits.pop(new_ix)
+                            search_hits.pop(new_ix, None)
                             not_matched.add(new_ix)
                 elif label in self.tree:
                     # All value objects with labels not specified in the other
                     # tree are treated as search hits (for this label).
                     unused_label = set.union(*self.tree[label].values())
                     for new_ix in search_hits:
-                        if search_hits[new_ix]:
+                        if search_hits[new_ix] is not None:
                             search_hits[new_ix] &= unused_label
                         else:
-                            search_hits[new_ix] |= unused_label
+                            search_hits[new_ix] = set(unused_label)
                 elif label in tree.tree:
                     raise ParamToolsError(
                         f"Label {label} was not defined in the defaults."
@@ -198,6 +199,75 @@ class Tree:
 
         return self.vos
 
+    def update_one(self, vo: ValueObject) -> List[ValueObject]:
+        """
+        Update this tree's value objects with a single value object. This
+        is equivalent to self.update(Tree([vo], self.label_grid)) but skips
+        building a tree for the new value object.
+
+        Returns:
+            List of updated value objects.
+
+        Raises:
+            ParamToolsError if a label is specied in the new value object
+                that is not present in the default value objects.
+        """
+        new_values = set([])
+        to_delete = set([])
+        self.init()
+        if not self.tree:
+            # this tree doesn't use labels; vo replaces all value objects.
+            del self.vos[:]
+            matched = False
+        else:
+            matched = True
+            search_hits = None
+            for label in self.label_grid:
+                if label in vo and label in self.tree:
+                    ixs = self.tree[label].get(vo[label])
+                    if ixs is None:
+                        matched = False
+                    elif matched:
+                        if search_hits is not None:
+                            search_hits &= ixs
+                        else:
+                            search_hits = set(ixs)
+                elif label in self.tree:
+                    if matched:
+                        unused_label = set.union(*self.tree[label].values())
+                        if search_hits is not None:
+                            search_hits &= unused_label
+                        else:
+                            search_hits = unused_label
+                elif label in vo:
+                    raise ParamToolsError(
+                        f"Label {label} was not defined in the defaults."
+                    )
+
+            if matched and search_hits:
+                if vo["value"] is not None:
+                    for search_hit_ix in search_hits:
+                        self.vos[search_hit_ix]["value"] = vo["value"]
+                else:
+                    to_delete = search_hits
+                    for ix in sorted(to_delete, reverse=True):
+                        del self.vos[ix]
+            else:
+                matched = False
+
+        if not matched and vo["value"] is not None:
+            self.vos.append(vo)
+            new_values.add(len(self.vos) - 1)
+
+        # It's faster to just re-build from scratch if values are deleted.
+        if to_delete:
+            self.new_values = None
+        else:
+            self.new_values = new_values
+        self.needs_build = True
+
+        return self.vos
+
     def select(
         self, labels: dict, cmp_func: CmpFunc, exact_match: bool = False
     ) -> List[ValueObject]:
@@ -5,6 +5,11 @@ from typing import List
 
 from paramtools.typing import ValueObject
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 
 def read_json(path):
     """
@@ -20,6 +25,20 @@ def read_json(path):
         return json.loads(path)
 
 
+def load_json(buf):
+    """
+    Parse a JSON str or bytes object. orjson is used if it is installed.
+    Anything it rejects, like NaN literals, is handed to the standard
+    library parser.
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(buf)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(buf)
+
+
 def get_example_paths(name):
     assert name in ("taxparams-demo",)
     current_path = os.path.abspath(os.path.dirname(__file__))
@@ -48,8 +67,12 @@ class LeafGetter:
             for _, v in item.items():
                 self.get(v)
         elif isinstance(item, list):
+            # only recurse into containers; leaves are appended directly.
             for li in item:
-                self.get(li)
+                if isinstance(li, (dict, list)):
+                    self.get(li)
+                else:
+                    self.leaves.append(li)
         else:
             self.leaves.append(item)
 
@@ -67,8 +90,7 @@ def ravel(nlabel_list):
     raveled = []
     for maybe_list in nlabel_list:
         if isinstance(maybe_list, list):
-            for item in maybe_list:
-                raveled.append(item)
+            raveled.extend(maybe_list)
         else:
             raveled.append(maybe_list)
     return raveled
@@ -90,9 +112,7 @@ def consistent_labels(value_items: List[ValueObject]):
 
 
 def ensure_value_object(vo) -> ValueObject:
-    if not isinstance(vo, list) or (
-        isinstance(vo, list) and not isinstance(vo[0], dict)
-    ):
+    if not isinstance(vo, list) or not isinstance(vo[0], dict):
         vo = [{"value": vo}]
     return vo
 
@@ -111,12 +131,11 @@ def filter_labels(vo: ValueObject, drop=None, keep=None) -> ValueObject:
     in keep if specified and dropping labels that are in drop.
     """
     drop = drop or ()
-    keep = keep or ()
-    return {
-        l: lv
-        for l, lv in vo.items()
-        if (l not in drop) and (not keep or l in keep)
-    }
+    if keep:
+        return {
+            l: lv for l, lv in vo.items() if l not in drop and l in keep
+        }
+    return {l: lv for l, lv in vo.items() if l not in drop}
 
 
 def make_label_str(vo: ValueObject) -> str:
@@ -132,10 +151,29 @@ def make_label_str(vo: ValueObject) -> str:
         return ""
 
 
-def grid_sort(vos, label_to_extend, grid):
+def grid_index(grid) -> dict:
+    """
+    Map each value in grid to the position of its first occurrence, i.e.
+    the value that grid.index would return.
+    """
+    ix = {}
+    for i, value in enumerate(grid):
+        ix.setdefault(value, i)
+    return ix
+
+
+def grid_sort(vos, label_to_extend, grid, grid_ix=None):
+    """
+    Sort value objects by the position of their label_to_extend value in
+    grid. grid_ix may be passed to look up positions in a prebuilt
+    {value: position} map instead of searching grid.
+    """
+    if grid_ix is None:
+        grid_ix = grid_index(grid)
+
     def key(v):
         if label_to_extend in v:
-            return grid.index(v[label_to_extend])
+            return grid_ix[v[label_to_extend]]
         else:
             return grid[0]
 